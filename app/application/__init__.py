@@ -1,11 +1,28 @@
 from app.application.dtos import (
     OnboardPayeeRequest,
+    PayeeListResponse,
     PayeeResponse,
+    PayeeSearchResponse,
+    PayeeSearchResult,
+    PayeeStatsResponse,
 )
+from app.application.list_payees import ListPayeesService
 from app.application.onboard_payee import OnboardPayeeService
+from app.application.payee_stats import PayeeStatsProjection, RebuildPayeeStatsService
+from app.application.retry_failed_payee import RetryFailedPayeeService
+from app.application.search_payees import SearchPayeesService
 
 __all__ = [
     "OnboardPayeeService",
+    "ListPayeesService",
+    "SearchPayeesService",
+    "RetryFailedPayeeService",
+    "RebuildPayeeStatsService",
+    "PayeeStatsProjection",
     "OnboardPayeeRequest",
     "PayeeResponse",
+    "PayeeListResponse",
+    "PayeeSearchResponse",
+    "PayeeSearchResult",
+    "PayeeStatsResponse",
 ]
@@ -1,9 +1,11 @@
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, EmailStr
 
+from app.domain.model import Payee
+
 
 class OnboardPayeeRequest(BaseModel):
     name: str
@@ -20,3 +22,51 @@ class PayeeResponse(BaseModel):
     psp_reference: Optional[str]
     created_at: datetime
     updated_at: datetime
+
+    @classmethod
+    def from_payee(cls, payee: Payee) -> "PayeeResponse":
+        return cls(
+            id=payee.id,
+            name=payee.name,
+            email=payee.email,
+            bank_account=payee.bank_account,
+            status=payee.status.value,
+            psp_reference=payee.psp_reference,
+            created_at=payee.created_at,
+            updated_at=payee.updated_at,
+        )
+
+
+class PayeeListResponse(BaseModel):
+    items: List[PayeeResponse]
+    next_cursor: Optional[UUID]
+
+
+class PayeeSearchResult(PayeeResponse):
+    score: float
+
+
+class PayeeSearchResponse(BaseModel):
+    items: List[PayeeSearchResult]
+
+
+class HourlyCount(BaseModel):
+    hour: datetime
+    count: int
+
+
+class OnboardedPayeeSummary(BaseModel):
+    payee_id: UUID
+    name: str
+    psp_reference: str
+    onboarded_at: datetime
+
+
+class PayeeStatsResponse(BaseModel):
+    total: int
+    status_counts: Dict[str, int]
+    onboarded_per_hour: List[HourlyCount]
+    latest_onboarded: List[OnboardedPayeeSummary]
+    # False while the read model is still being caught up with the repository
+    # at startup; counts then cover only part of the existing payees.
+    ready: bool = True
@@ -0,0 +1,17 @@
+from typing import Optional
+from uuid import UUID
+
+from app.application.dtos import PayeeListResponse, PayeeResponse
+from app.domain.ports import PayeeRepository
+
+
+class ListPayeesService:
+    def __init__(self, repository: PayeeRepository):
+        self.repository = repository
+
+    def execute(self, after: Optional[UUID] = None, limit: int = 50) -> PayeeListResponse:
+        payees = self.repository.list_after(after, limit)
+        return PayeeListResponse(
+            items=[PayeeResponse.from_payee(payee) for payee in payees],
+            next_cursor=payees[-1].id if len(payees) == limit else None,
+        )
@@ -1,7 +1,15 @@
+from typing import Optional
+
 from app.application.dtos import OnboardPayeeRequest, PayeeResponse
 from app.domain.events import PayeeOnboardedEvent
 from app.domain.model import Payee
-from app.domain.ports import PublishPayeeOnboardedEvent, PayeeRepository, PSPClient
+from app.domain.ports import (
+    IdGenerator,
+    PayeeRepository,
+    PSPClient,
+    PublishDomainEvent,
+    PublishPayeeOnboardedEvent,
+)
 
 
 class OnboardPayeeService:
@@ -10,20 +18,32 @@ class OnboardPayeeService:
         repository: PayeeRepository,
         psp_client: PSPClient,
         publish_payee_onboarded_event: PublishPayeeOnboardedEvent,
+        id_generator: Optional[IdGenerator] = None,
+        publish_domain_event: Optional[PublishDomainEvent] = None,
     ):
         self.repository = repository
         self.psp_client = psp_client
         self.publish_payee_onboarded_event = publish_payee_onboarded_event
+        self.id_generator = id_generator
+        self.publish_domain_event = publish_domain_event
     
     def execute(self, request: OnboardPayeeRequest) -> PayeeResponse:
         payee = Payee.create(
             name=request.name,
             email=request.email,
             bank_account=request.bank_account,
+            id_generator=self.id_generator,
         )
         
         self.repository.save(payee)
+        # Publish the creation as soon as the row exists, not after the PSP
+        # call, so read models never see the row long before its event.
+        self.publish_domain_events(payee)
         
+        return self.onboard_in_psp(payee)
+    
+    def onboard_in_psp(self, payee: Payee) -> PayeeResponse:
+        payee.record_onboarding_attempt()
         try:
             psp_reference = self.psp_client.onboard_payee(
                 name=payee.name,
@@ -36,26 +56,28 @@ class OnboardPayeeService:
         except Exception:
             payee.mark_as_failed()
             self.repository.update(payee)
+            self.publish_domain_events(payee)
             raise
 
         self.repository.update(payee)
+        self.publish_domain_events(payee)
 
         event = PayeeOnboardedEvent.create(
             payee_id=payee.id,
             name=payee.name,
             email=payee.email,
             psp_reference=psp_reference,
-            timestamp=payee.updated_at,
+            timestamp=payee.onboarded_at,
         )
         self.publish_payee_onboarded_event.execute(event)
+        if self.publish_domain_event is not None:
+            self.publish_domain_event.execute(event)
         
-        return PayeeResponse(
-            id=payee.id,
-            name=payee.name,
-            email=payee.email,
-            bank_account=payee.bank_account,
-            status=payee.status.value,
-            psp_reference=payee.psp_reference,
-            created_at=payee.created_at,
-            updated_at=payee.updated_at,
-        )
+        return PayeeResponse.from_payee(payee)
+    
+    def publish_domain_events(self, payee: Payee) -> None:
+        events = payee.pull_events()
+        if self.publish_domain_event is None:
+            return
+        for event in events:
+            self.publish_domain_event.execute(event)
@@ -0,0 +1,155 @@
+import threading
+from bisect import insort
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from app.application.dtos import (
+    HourlyCount,
+    OnboardedPayeeSummary,
+    PayeeStatsResponse,
+)
+from app.domain.events import DomainEvent, PayeeOnboardedEvent, PayeeStatusChangedEvent
+from app.domain.model import PayeeStatus
+from app.domain.ports import PayeeRepository
+
+
+class _PayeeStats:
+    # The projection's state. Applying a fact that is already reflected is a
+    # no-op, so the same change can arrive both from a repository scan and as
+    # an event without being counted twice.
+    def __init__(self, latest_limit: int, retention_hours: int):
+        self.latest_limit = latest_limit
+        self.retention_hours = retention_hours
+        self.status_counts: Dict[PayeeStatus, int] = {status: 0 for status in PayeeStatus}
+        self.statuses: Dict[UUID, PayeeStatus] = {}
+        self.onboarded: Set[UUID] = set()
+        self.onboarded_per_hour: Dict[datetime, int] = {}
+        self.latest: List[Tuple[datetime, UUID, str, str]] = []
+
+    def apply(self, event: DomainEvent) -> None:
+        if isinstance(event, PayeeStatusChangedEvent):
+            self.set_status(event.payee_id, event.new_status)
+        elif isinstance(event, PayeeOnboardedEvent):
+            self.record_onboarding(event.payee_id, event.name, event.psp_reference, event.timestamp)
+
+    def set_status(self, payee_id: UUID, status: PayeeStatus) -> None:
+        # Moves the payee from the status last applied for it, not from the
+        # event's previous status, which a rebuild may already have moved past.
+        current = self.statuses.get(payee_id)
+        if current == status:
+            return
+        if current is not None:
+            self.status_counts[current] -= 1
+        self.status_counts[status] += 1
+        self.statuses[payee_id] = status
+
+    def record_onboarding(
+        self,
+        payee_id: UUID,
+        name: str,
+        psp_reference: str,
+        onboarded_at: datetime,
+    ) -> None:
+        if payee_id in self.onboarded:
+            return
+        self.onboarded.add(payee_id)
+
+        hour = onboarded_at.replace(minute=0, second=0, microsecond=0)
+        self.onboarded_per_hour[hour] = self.onboarded_per_hour.get(hour, 0) + 1
+        if len(self.onboarded_per_hour) > self.retention_hours:
+            del self.onboarded_per_hour[min(self.onboarded_per_hour)]
+
+        insort(self.latest, (onboarded_at, payee_id, name, psp_reference))
+        if len(self.latest) > self.latest_limit:
+            self.latest.pop(0)
+
+
+class PayeeStatsProjection:
+    """Denormalized read model of payee statistics, maintained from domain events.
+
+    Keeps per-status counters, onboarding counts per hour (the most recent
+    ``retention_hours`` buckets) and the ``latest_limit`` most recently onboarded
+    payees, so reads never touch the repository. Events are applied
+    idempotently: the last applied status and whether the onboarding was
+    counted are tracked per payee.
+
+    ``rebuild`` recomputes the state from the repository without holding the
+    lock, so event handlers are not blocked by the scan. Events handled during
+    the scan are buffered and replayed onto the rebuilt state before it
+    replaces the current one.
+    """
+
+    def __init__(self, latest_limit: int = 10, retention_hours: int = 168):
+        self.latest_limit = latest_limit
+        self.retention_hours = retention_hours
+        self._lock = threading.Lock()
+        self._state = _PayeeStats(latest_limit, retention_hours)
+        self._rebuild_buffers: List[List[DomainEvent]] = []
+
+    def handle(self, event: DomainEvent) -> None:
+        with self._lock:
+            self._state.apply(event)
+            for buffer in self._rebuild_buffers:
+                buffer.append(event)
+
+    def rebuild(self, repository: PayeeRepository, batch_size: int = 1000) -> None:
+        buffer: List[DomainEvent] = []
+        with self._lock:
+            self._rebuild_buffers.append(buffer)
+        state: Optional[_PayeeStats] = None
+        try:
+            state = self._scan(repository, batch_size)
+        finally:
+            with self._lock:
+                self._rebuild_buffers.remove(buffer)
+                if state is not None:
+                    for event in buffer:
+                        state.apply(event)
+                    self._state = state
+
+    def snapshot(self) -> PayeeStatsResponse:
+        with self._lock:
+            state = self._state
+            return PayeeStatsResponse(
+                total=sum(state.status_counts.values()),
+                status_counts={status.value: count for status, count in state.status_counts.items()},
+                onboarded_per_hour=[
+                    HourlyCount(hour=hour, count=count)
+                    for hour, count in sorted(state.onboarded_per_hour.items())
+                ],
+                latest_onboarded=[
+                    OnboardedPayeeSummary(
+                        payee_id=payee_id,
+                        name=name,
+                        psp_reference=psp_reference,
+                        onboarded_at=onboarded_at,
+                    )
+                    for onboarded_at, payee_id, name, psp_reference in reversed(state.latest)
+                ],
+            )
+
+    def _scan(self, repository: PayeeRepository, batch_size: int) -> _PayeeStats:
+        state = _PayeeStats(self.latest_limit, self.retention_hours)
+        cursor = None
+        while True:
+            payees = repository.list_after(cursor, batch_size)
+            if not payees:
+                return state
+            for payee in payees:
+                state.set_status(payee.id, payee.status)
+                if payee.onboarded_at is not None:
+                    state.record_onboarding(
+                        payee.id, payee.name, payee.psp_reference, payee.onboarded_at
+                    )
+            cursor = payees[-1].id
+
+
+class RebuildPayeeStatsService:
+    def __init__(self, repository: PayeeRepository, projection: PayeeStatsProjection):
+        self.repository = repository
+        self.projection = projection
+
+    def execute(self) -> PayeeStatsResponse:
+        self.projection.rebuild(self.repository)
+        return self.projection.snapshot()
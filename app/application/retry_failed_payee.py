@@ -0,0 +1,26 @@
+from uuid import UUID
+
+from app.application.dtos import PayeeResponse
+from app.application.onboard_payee import OnboardPayeeService
+from app.domain.exceptions import PayeeNotFoundError
+from app.domain.ports import PayeeRepository
+
+
+class RetryFailedPayeeService:
+    def __init__(
+        self,
+        repository: PayeeRepository,
+        onboard_payee_service: OnboardPayeeService,
+    ):
+        self.repository = repository
+        self.onboard_payee_service = onboard_payee_service
+
+    def execute(self, payee_id: UUID) -> PayeeResponse:
+        payee = self.repository.find_by_id(payee_id)
+        if payee is None:
+            raise PayeeNotFoundError(f"Payee {payee_id} not found")
+
+        payee.retry_onboarding()
+        self.repository.update(payee)
+
+        return self.onboard_payee_service.onboard_in_psp(payee)
@@ -0,0 +1,22 @@
+from app.application.dtos import PayeeResponse, PayeeSearchResponse, PayeeSearchResult
+from app.domain.ports import PayeeRepository, PayeeSearchIndex
+
+
+class SearchPayeesService:
+    def __init__(self, search_index: PayeeSearchIndex, repository: PayeeRepository):
+        self.search_index = search_index
+        self.repository = repository
+
+    def execute(self, query: str, limit: int = 20) -> PayeeSearchResponse:
+        items = []
+        for hit in self.search_index.search(query, limit):
+            payee = self.repository.find_by_id(hit.payee_id)
+            if payee is None:
+                continue
+            items.append(
+                PayeeSearchResult(
+                    **PayeeResponse.from_payee(payee).model_dump(),
+                    score=hit.score,
+                )
+            )
+        return PayeeSearchResponse(items=items)
@@ -0,0 +1,62 @@
+import os
+from dataclasses import dataclass
+from typing import Mapping, Optional
+
+
+def _flag(value: str) -> bool:
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Runtime configuration, read from environment variables by ``from_env``.
+
+    Adapter fields name an entry in the adapter registry, e.g.
+    ``PAYEE_REPOSITORY=sqlite`` or ``PSP_CLIENT=http``.
+    """
+
+    payee_repository: str = "memory"
+    database_path: str = "payees.db"
+    psp_client: str = "mock"
+    psp_base_url: str = "http://localhost:9000"
+    psp_api_key: str = ""
+    psp_timeout: float = 10.0
+    psp_batching: bool = False
+    psp_max_batch_size: int = 50
+    psp_max_wait_seconds: float = 0.005
+    event_publisher: str = "mock"
+    id_generator: str = "uuid7"
+    snowflake_worker_id: int = 0
+    retry_scheduler_enabled: bool = True
+    read_model_warmup: str = "background"
+    traffic_capture_path: Optional[str] = None
+    traffic_capture_salt: Optional[str] = None
+    traffic_capture_sample_rate: float = 1.0
+
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "Settings":
+        env = os.environ if environ is None else environ
+        defaults = cls()
+        return cls(
+            payee_repository=env.get("PAYEE_REPOSITORY", defaults.payee_repository),
+            database_path=env.get("DATABASE_PATH", defaults.database_path),
+            psp_client=env.get("PSP_CLIENT", defaults.psp_client),
+            psp_base_url=env.get("PSP_BASE_URL", defaults.psp_base_url),
+            psp_api_key=env.get("PSP_API_KEY", defaults.psp_api_key),
+            psp_timeout=float(env.get("PSP_TIMEOUT", defaults.psp_timeout)),
+            psp_batching=_flag(env.get("PSP_BATCHING", str(defaults.psp_batching))),
+            psp_max_batch_size=int(env.get("PSP_MAX_BATCH_SIZE", defaults.psp_max_batch_size)),
+            psp_max_wait_seconds=float(env.get("PSP_MAX_WAIT_SECONDS", defaults.psp_max_wait_seconds)),
+            event_publisher=env.get("EVENT_PUBLISHER", defaults.event_publisher),
+            id_generator=env.get("ID_GENERATOR", defaults.id_generator),
+            snowflake_worker_id=int(env.get("SNOWFLAKE_WORKER_ID", defaults.snowflake_worker_id)),
+            retry_scheduler_enabled=_flag(
+                env.get("RETRY_SCHEDULER_ENABLED", str(defaults.retry_scheduler_enabled))
+            ),
+            read_model_warmup=env.get("READ_MODEL_WARMUP", defaults.read_model_warmup),
+            traffic_capture_path=env.get("TRAFFIC_CAPTURE_PATH") or None,
+            traffic_capture_salt=env.get("TRAFFIC_CAPTURE_SALT") or None,
+            traffic_capture_sample_rate=float(
+                env.get("TRAFFIC_CAPTURE_SAMPLE_RATE", defaults.traffic_capture_sample_rate)
+            ),
+        )
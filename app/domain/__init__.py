@@ -1,16 +1,30 @@
-from app.domain.events import DomainEvent, PayeeOnboardedEvent
-from app.domain.exceptions import DomainException, InvalidStatusTransitionError
+from app.domain.events import DomainEvent, PayeeOnboardedEvent, PayeeStatusChangedEvent
+from app.domain.exceptions import DomainException, InvalidStatusTransitionError, PayeeNotFoundError
 from app.domain.model import Payee, PayeeStatus
-from app.domain.ports import PublishPayeeOnboardedEvent, PayeeRepository, PSPClient
+from app.domain.ports import (
+    IdGenerator,
+    PayeeRepository,
+    PayeeSearchHit,
+    PayeeSearchIndex,
+    PSPClient,
+    PublishDomainEvent,
+    PublishPayeeOnboardedEvent,
+)
 
 __all__ = [
     "Payee",
     "PayeeStatus",
     "PayeeRepository",
     "PSPClient",
+    "IdGenerator",
+    "PayeeSearchIndex",
+    "PayeeSearchHit",
     "PublishPayeeOnboardedEvent",
+    "PublishDomainEvent",
     "DomainEvent",
     "PayeeOnboardedEvent",
+    "PayeeStatusChangedEvent",
     "DomainException",
     "InvalidStatusTransitionError",
+    "PayeeNotFoundError",
 ]
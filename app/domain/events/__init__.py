@@ -1,5 +1,5 @@
 from app.domain.events.domain_event import DomainEvent
 from app.domain.events.payee_onboarded_event import PayeeOnboardedEvent
+from app.domain.events.payee_status_changed_event import PayeeStatusChangedEvent
 
-__all__ = ["DomainEvent", "PayeeOnboardedEvent"]
-
+__all__ = ["DomainEvent", "PayeeOnboardedEvent", "PayeeStatusChangedEvent"]
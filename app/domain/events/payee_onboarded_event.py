@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from app.domain.events.domain_event import DomainEvent
 
@@ -13,6 +13,7 @@ class PayeeOnboardedEvent(DomainEvent):
     email: str
     psp_reference: str
     timestamp: datetime
+    event_id: UUID = field(default_factory=uuid4)
 
     @classmethod
     def create(
@@ -31,4 +32,3 @@ class PayeeOnboardedEvent(DomainEvent):
             psp_reference=psp_reference,
             timestamp=timestamp,
         )
-
@@ -0,0 +1,35 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+from uuid import UUID, uuid4
+
+from app.domain.events.domain_event import DomainEvent
+
+if TYPE_CHECKING:
+    from app.domain.model.payee_status import PayeeStatus
+
+
+@dataclass
+class PayeeStatusChangedEvent(DomainEvent):
+    event_type: str
+    payee_id: UUID
+    previous_status: Optional["PayeeStatus"]
+    new_status: "PayeeStatus"
+    timestamp: datetime
+    event_id: UUID = field(default_factory=uuid4)
+
+    @classmethod
+    def create(
+        cls,
+        payee_id: UUID,
+        previous_status: Optional["PayeeStatus"],
+        new_status: "PayeeStatus",
+        timestamp: datetime,
+    ) -> "PayeeStatusChangedEvent":
+        return cls(
+            event_type="payee_status_changed",
+            payee_id=payee_id,
+            previous_status=previous_status,
+            new_status=new_status,
+            timestamp=timestamp,
+        )
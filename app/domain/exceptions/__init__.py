@@ -2,6 +2,6 @@ from app.domain.exceptions.domain_exception import DomainException
 from app.domain.exceptions.invalid_status_transition_error import (
     InvalidStatusTransitionError,
 )
+from app.domain.exceptions.payee_not_found_error import PayeeNotFoundError
 
-__all__ = ["DomainException", "InvalidStatusTransitionError"]
-
+__all__ = ["DomainException", "InvalidStatusTransitionError", "PayeeNotFoundError"]
@@ -0,0 +1,5 @@
+from app.domain.exceptions.domain_exception import DomainException
+
+
+class PayeeNotFoundError(DomainException):
+    pass
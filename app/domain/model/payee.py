@@ -1,13 +1,18 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID, uuid4
 
+from app.domain.events.domain_event import DomainEvent
+from app.domain.events.payee_status_changed_event import PayeeStatusChangedEvent
 from app.domain.exceptions.invalid_status_transition_error import (
     InvalidStatusTransitionError,
 )
 from app.domain.model.payee_status import PayeeStatus
 
+if TYPE_CHECKING:
+    from app.domain.ports.id_generator import IdGenerator
+
 
 @dataclass
 class Payee:
@@ -19,6 +24,11 @@ class Payee:
     psp_reference: Optional[str]
     created_at: datetime
     updated_at: datetime
+    onboarding_attempts: int = 0
+    onboarded_at: Optional[datetime] = None
+    _pending_events: List[DomainEvent] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
     
     @classmethod
     def create(
@@ -26,10 +36,11 @@ class Payee:
         name: str,
         email: str,
         bank_account: str,
+        id_generator: Optional["IdGenerator"] = None,
     ) -> "Payee":
         now = datetime.utcnow()
-        return cls(
-            id=uuid4(),
+        payee = cls(
+            id=id_generator.generate() if id_generator else uuid4(),
             name=name,
             email=email,
             bank_account=bank_account,
@@ -38,10 +49,21 @@ class Payee:
             created_at=now,
             updated_at=now,
         )
+        payee._pending_events.append(
+            PayeeStatusChangedEvent.create(
+                payee_id=payee.id,
+                previous_status=None,
+                new_status=payee.status,
+                timestamp=now,
+            )
+        )
+        return payee
     
     def set_psp_reference(self, psp_reference: str) -> None:
         self.psp_reference = psp_reference
         self.updated_at = datetime.utcnow()
+        if self.onboarded_at is None:
+            self.onboarded_at = self.updated_at
     
     def activate(self) -> None:
         self._transition_to(PayeeStatus.ACTIVE)
@@ -60,12 +82,32 @@ class Payee:
             raise InvalidStatusTransitionError(
                 f"Cannot transition from {self.status.value} to {new_status.value}"
             )
+        previous_status = self.status
         self.status = new_status
         self.updated_at = datetime.utcnow()
+        self._pending_events.append(
+            PayeeStatusChangedEvent.create(
+                payee_id=self.id,
+                previous_status=previous_status,
+                new_status=new_status,
+                timestamp=self.updated_at,
+            )
+        )
     
     def mark_as_failed(self) -> None:
         self._transition_to(PayeeStatus.FAILED)
     
+    def retry_onboarding(self) -> None:
+        self._transition_to(PayeeStatus.PENDING)
+    
+    def record_onboarding_attempt(self) -> None:
+        self.onboarding_attempts += 1
+        self.updated_at = datetime.utcnow()
+    
+    def pull_events(self) -> List[DomainEvent]:
+        events, self._pending_events = self._pending_events, []
+        return events
+    
     @property
     def is_active(self) -> bool:
         return self.status == PayeeStatus.ACTIVE
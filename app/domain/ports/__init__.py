@@ -1,6 +1,17 @@
+from app.domain.ports.id_generator import IdGenerator
+from app.domain.ports.publish_domain_event import PublishDomainEvent
 from app.domain.ports.publish_payee_onboarded_event import PublishPayeeOnboardedEvent
 from app.domain.ports.payee_repository import PayeeRepository
-from app.domain.ports.psp_client import PSPClient
-
-__all__ = ["PublishPayeeOnboardedEvent", "PayeeRepository", "PSPClient"]
+from app.domain.ports.payee_search_index import PayeeSearchHit, PayeeSearchIndex
+from app.domain.ports.psp_client import PSPClient, PSPPayee
 
+__all__ = [
+    "IdGenerator",
+    "PublishDomainEvent",
+    "PublishPayeeOnboardedEvent",
+    "PayeeRepository",
+    "PayeeSearchHit",
+    "PayeeSearchIndex",
+    "PSPClient",
+    "PSPPayee",
+]
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from app.domain.model.payee import Payee
+from app.domain.model.payee_status import PayeeStatus
 
 
 class PayeeRepository(ABC):
@@ -17,4 +18,23 @@ class PayeeRepository(ABC):
     @abstractmethod
     def update(self, payee: Payee) -> None:
         pass
-
+    
+    @abstractmethod
+    def list_after(self, after_id: Optional[UUID], limit: int) -> List[Payee]:
+        # Returns up to ``limit`` payees with an id greater than ``after_id`` in id
+        # order. With a time-ordered IdGenerator this is creation order.
+        pass
+    
+    @abstractmethod
+    def find_by_status(
+        self,
+        status: PayeeStatus,
+        after_id: Optional[UUID],
+        limit: int,
+        max_attempts: Optional[int] = None,
+    ) -> List[Payee]:
+        # Indexed lookup: up to ``limit`` payees in ``status`` with an id greater
+        # than ``after_id``, in id order. With ``max_attempts``, only payees with
+        # fewer onboarding attempts are returned; implementations should check
+        # this on the index rather than loading and filtering whole payees.
+        pass
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List
+from uuid import UUID
+
+from app.domain.model.payee import Payee
+
+
+@dataclass(frozen=True)
+class PayeeSearchHit:
+    payee_id: UUID
+    score: float
+
+
+class PayeeSearchIndex(ABC):
+    @abstractmethod
+    def index(self, payee: Payee) -> None:
+        pass
+
+    @abstractmethod
+    def search(self, query: str, limit: int) -> List[PayeeSearchHit]:
+        pass
@@ -1,4 +1,13 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List, Union
+
+
+@dataclass(frozen=True)
+class PSPPayee:
+    name: str
+    email: str
+    bank_account: str
 
 
 class PSPClient(ABC):
@@ -11,3 +20,20 @@ class PSPClient(ABC):
     ) -> str:
         pass
 
+    def onboard_payees(self, payees: List[PSPPayee]) -> List[Union[str, Exception]]:
+        # Optional batch operation. Results are positional: each entry is either the
+        # PSP reference for the payee at the same index or the error it failed with.
+        # Adapters whose PSP offers a bulk API should override this.
+        results: List[Union[str, Exception]] = []
+        for payee in payees:
+            try:
+                results.append(
+                    self.onboard_payee(
+                        name=payee.name,
+                        email=payee.email,
+                        bank_account=payee.bank_account,
+                    )
+                )
+            except Exception as e:
+                results.append(e)
+        return results
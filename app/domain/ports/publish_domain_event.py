@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+from app.domain.events import DomainEvent
+
+
+class PublishDomainEvent(ABC):
+    @abstractmethod
+    def execute(self, event: DomainEvent) -> None:
+        pass
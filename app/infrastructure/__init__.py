@@ -1,12 +1,42 @@
-from app.infrastructure.database import InMemoryPayeeRepository
-from app.infrastructure.psp_client import HTTPPSPClient, MockPSPClient
-from app.infrastructure.pubsub import KafkaPublisher, KafkaPublishPayeeOnboardedEvent, MockPublishPayeeOnboardedEvent
-
-__all__ = [
-    "InMemoryPayeeRepository",
-    "MockPSPClient",
-    "HTTPPSPClient",
-    "KafkaPublisher",
-    "KafkaPublishPayeeOnboardedEvent",
-    "MockPublishPayeeOnboardedEvent",
-]
+from importlib import import_module
+
+# Adapters are resolved on first attribute access, so importing one adapter
+# module does not load every other adapter and its dependencies.
+_EXPORTS = {
+    "InMemoryPayeeRepository": "app.infrastructure.database",
+    "SQLitePayeeRepository": "app.infrastructure.database",
+    "UUID4IdGenerator": "app.infrastructure.id_generator",
+    "UUID7IdGenerator": "app.infrastructure.id_generator",
+    "SnowflakeIdGenerator": "app.infrastructure.id_generator",
+    "MockPSPClient": "app.infrastructure.psp_client",
+    "HTTPPSPClient": "app.infrastructure.psp_client",
+    "BatchingPSPClient": "app.infrastructure.psp_client",
+    "PSPError": "app.infrastructure.psp_client",
+    "KafkaPublisher": "app.infrastructure.pubsub",
+    "KafkaPublishPayeeOnboardedEvent": "app.infrastructure.pubsub",
+    "MockPublishPayeeOnboardedEvent": "app.infrastructure.pubsub",
+    "PAYEE_TOPIC": "app.infrastructure.pubsub",
+    "ConsumerRecord": "app.infrastructure.pubsub",
+    "InMemoryKafkaBroker": "app.infrastructure.pubsub",
+    "InMemoryDomainEventBus": "app.infrastructure.pubsub",
+    "PartitionedConsumer": "app.infrastructure.consumer",
+    "TrigramPayeeSearchIndex": "app.infrastructure.search",
+    "SearchIndexingPayeeRepository": "app.infrastructure.search",
+    "AdapterRegistry": "app.infrastructure.registry",
+    "adapters": "app.infrastructure.registry",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,199 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional
+
+from app.infrastructure.pubsub import ConsumerRecord, InMemoryKafkaBroker
+
+logger = logging.getLogger(__name__)
+
+BatchHandler = Callable[[List[ConsumerRecord]], None]
+DedupKey = Callable[[ConsumerRecord], Optional[Hashable]]
+DeadLetterHandler = Callable[[ConsumerRecord, Exception], None]
+
+
+def event_id_dedup_key(record: ConsumerRecord) -> Optional[Hashable]:
+    return record.value.get("event_id")
+
+
+def log_dead_letter(record: ConsumerRecord, error: Exception) -> None:
+    logger.error(
+        "Skipping %s partition %s offset %s after repeated failures: %s",
+        record.topic,
+        record.partition,
+        record.offset,
+        error,
+    )
+
+
+class _SeenEvents:
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._keys: "OrderedDict[Hashable, None]" = OrderedDict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._keys
+
+    def add(self, key: Hashable) -> None:
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+        if len(self._keys) > self.capacity:
+            self._keys.popitem(last=False)
+
+
+class PartitionedConsumer:
+    """Consumes a topic with a pool of workers, each owning a fixed set of partitions.
+
+    Messages are keyed by payee id, so every event for a payee lands in the same
+    partition and is handled by the same worker in offset order, while different
+    partitions are processed in parallel. Records are handed to ``handler`` in
+    batches; the partition offset is committed only after the handler returns,
+    so a failing batch is retried rather than lost. After ``max_retries`` failed
+    retries the batch is handled one record at a time: records that still fail
+    are passed to ``dead_letter`` and committed past, so a poison record cannot
+    stall its partition. Redelivered events (same ``dedup_key``) seen within the
+    last ``dedup_window`` events of a partition are skipped.
+    """
+
+    def __init__(
+        self,
+        broker: InMemoryKafkaBroker,
+        topic: str,
+        group_id: str,
+        handler: BatchHandler,
+        workers: int = 4,
+        max_batch_size: int = 100,
+        poll_timeout: float = 0.05,
+        retry_backoff: float = 0.1,
+        dedup_key: DedupKey = event_id_dedup_key,
+        dedup_window: int = 10_000,
+        max_retries: int = 5,
+        dead_letter: DeadLetterHandler = log_dead_letter,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        self.broker = broker
+        self.topic = topic
+        self.group_id = group_id
+        self.handler = handler
+        self.workers = min(workers, broker.partitions)
+        self.max_batch_size = max_batch_size
+        self.poll_timeout = poll_timeout
+        self.retry_backoff = retry_backoff
+        self.dedup_key = dedup_key
+        self.max_retries = max_retries
+        self.dead_letter = dead_letter
+        self.processed = 0
+        self.duplicates_skipped = 0
+        self.dead_lettered = 0
+        self._seen: Dict[int, _SeenEvents] = {
+            partition: _SeenEvents(dedup_window) for partition in range(broker.partitions)
+        }
+        self._stats_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def assigned_partitions(self, worker: int) -> List[int]:
+        return list(range(worker, self.broker.partitions, self.workers))
+
+    def start(self) -> None:
+        if self._threads:
+            raise RuntimeError("Consumer already started")
+        self._stopping.clear()
+        self._threads = [
+            threading.Thread(
+                target=self._run_worker,
+                args=(self.assigned_partitions(worker),),
+                name=f"{self.group_id}-worker-{worker}",
+                daemon=True,
+            )
+            for worker in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stopping.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def wait_until_caught_up(self, timeout: float = 10.0) -> bool:
+        deadline = time.monotonic() + timeout
+        while self.broker.lag(self.group_id, self.topic) > 0:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.001)
+        return True
+
+    def _run_worker(self, partitions: List[int]) -> None:
+        positions = {
+            partition: self.broker.committed(self.group_id, self.topic, partition)
+            for partition in partitions
+        }
+        failures = dict.fromkeys(partitions, 0)
+        while not self._stopping.is_set():
+            handled_any = False
+            for partition in partitions:
+                isolate = failures[partition] > self.max_retries
+                try:
+                    if self._poll_partition(partition, positions, isolate):
+                        handled_any = True
+                    failures[partition] = 0
+                except Exception:
+                    failures[partition] += 1
+                    logger.exception(
+                        "Handler failed for %s partition %s at offset %s; retrying",
+                        self.topic,
+                        partition,
+                        positions[partition],
+                    )
+                    self._stopping.wait(self.retry_backoff)
+            if not handled_any:
+                self.broker.wait_for_messages(self.poll_timeout)
+
+    def _poll_partition(
+        self, partition: int, positions: Dict[int, int], isolate: bool = False
+    ) -> bool:
+        records = self.broker.fetch(
+            self.topic, partition, positions[partition], self.max_batch_size
+        )
+        if not records:
+            return False
+
+        seen = self._seen[partition]
+        batch: List[ConsumerRecord] = []
+        batch_keys = set()
+        for record in records:
+            key = self.dedup_key(record)
+            if key is not None and (key in seen or key in batch_keys):
+                continue
+            if key is not None:
+                batch_keys.add(key)
+            batch.append(record)
+
+        dead_lettered = 0
+        if isolate:
+            for record in batch:
+                try:
+                    self.handler([record])
+                except Exception as error:
+                    self.dead_letter(record, error)
+                    dead_lettered += 1
+        elif batch:
+            self.handler(batch)
+        for key in batch_keys:
+            seen.add(key)
+
+        next_offset = records[-1].offset + 1
+        self.broker.commit(self.group_id, self.topic, partition, next_offset)
+        positions[partition] = next_offset
+
+        with self._stats_lock:
+            self.processed += len(batch) - dead_lettered
+            self.dead_lettered += dead_lettered
+            self.duplicates_skipped += len(records) - len(batch)
+        return True
@@ -1,21 +1,240 @@
-from typing import Dict, Optional
+import heapq
+import threading
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-from app.domain.model import Payee
+from app.domain.model import Payee, PayeeStatus
 from app.domain.ports import PayeeRepository
 
 
 class InMemoryPayeeRepository(PayeeRepository):
     def __init__(self):
         self._storage: Dict[UUID, Payee] = {}
-    
+        # Ids kept sorted for range scans.
+        self._ordered_ids: List[UUID] = []
+        # Secondary index: sorted ids per (status, onboarding attempts). Stored payees
+        # are mutated in place, so the indexed key is tracked separately to know
+        # what to move on update.
+        self._ids_by_status: Dict[PayeeStatus, Dict[int, List[UUID]]] = {
+            status: {} for status in PayeeStatus
+        }
+        self._indexed_key: Dict[UUID, Tuple[PayeeStatus, int]] = {}
+        self._lock = threading.Lock()
+
     def save(self, payee: Payee) -> None:
-        self._storage[payee.id] = payee
-    
+        with self._lock:
+            if payee.id not in self._storage:
+                self._insert_sorted(self._ordered_ids, payee.id)
+                self._index_status(payee)
+            else:
+                self._reindex_status(payee)
+            self._storage[payee.id] = payee
+
     def find_by_id(self, payee_id: UUID) -> Optional[Payee]:
         return self._storage.get(payee_id)
-    
+
+    def update(self, payee: Payee) -> None:
+        with self._lock:
+            if payee.id not in self._storage:
+                raise ValueError(f"Payee {payee.id} not found")
+            self._reindex_status(payee)
+            self._storage[payee.id] = payee
+
+    def list_after(self, after_id: Optional[UUID], limit: int) -> List[Payee]:
+        with self._lock:
+            return self._page(self._ordered_ids, after_id, limit)
+
+    def find_by_status(
+        self,
+        status: PayeeStatus,
+        after_id: Optional[UUID],
+        limit: int,
+        max_attempts: Optional[int] = None,
+    ) -> List[Payee]:
+        with self._lock:
+            # Merge the id-sorted lists of the matching attempt counts, reading at
+            # most ``limit`` ids from each.
+            pages = []
+            for attempts, ids in self._ids_by_status[status].items():
+                if max_attempts is None or attempts < max_attempts:
+                    start = bisect_right(ids, after_id) if after_id else 0
+                    pages.append(ids[start:start + limit])
+            return [
+                self._storage[payee_id]
+                for payee_id in islice(heapq.merge(*pages), limit)
+            ]
+
+    def _page(self, ids: List[UUID], after_id: Optional[UUID], limit: int) -> List[Payee]:
+        start = bisect_right(ids, after_id) if after_id else 0
+        return [self._storage[payee_id] for payee_id in ids[start:start + limit]]
+
+    def _index_status(self, payee: Payee) -> None:
+        key = (payee.status, payee.onboarding_attempts)
+        ids = self._ids_by_status[payee.status].setdefault(payee.onboarding_attempts, [])
+        self._insert_sorted(ids, payee.id)
+        self._indexed_key[payee.id] = key
+
+    def _reindex_status(self, payee: Payee) -> None:
+        status, attempts = self._indexed_key[payee.id]
+        if (status, attempts) == (payee.status, payee.onboarding_attempts):
+            return
+        ids = self._ids_by_status[status][attempts]
+        del ids[bisect_left(ids, payee.id)]
+        if not ids:
+            del self._ids_by_status[status][attempts]
+        self._index_status(payee)
+
+    @staticmethod
+    def _insert_sorted(ids: List[UUID], payee_id: UUID) -> None:
+        # Time-ordered ids arrive in ascending order, so this is usually an append.
+        if not ids or payee_id > ids[-1]:
+            ids.append(payee_id)
+        else:
+            insort(ids, payee_id)
+
+
+class SQLitePayeeRepository(PayeeRepository):
+    # Ids are stored as 16-byte big-endian blobs in a WITHOUT ROWID table, so the
+    # primary key B-tree is the table itself and byte order matches UUID order.
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS payees (
+            id BLOB PRIMARY KEY,
+            name TEXT NOT NULL,
+            email TEXT NOT NULL,
+            bank_account TEXT NOT NULL,
+            status TEXT NOT NULL,
+            psp_reference TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            onboarding_attempts INTEGER NOT NULL DEFAULT 0,
+            onboarded_at TEXT
+        ) WITHOUT ROWID
+    """
+    # Ordered by id within a status so retry scans seek straight to after_id and
+    # read in ORDER BY order; onboarding_attempts is carried in the index so the
+    # max_attempts filter is checked on index entries without reading the row.
+    _STATUS_INDEX = (
+        "CREATE INDEX IF NOT EXISTS payees_status_id_attempts "
+        "ON payees (status, id, onboarding_attempts)"
+    )
+    _REPLACED_INDEXES = ("payees_status_id", "payees_status_attempts_id")
+    _COLUMNS = (
+        "id, name, email, bank_account, status, psp_reference, "
+        "created_at, updated_at, onboarding_attempts, onboarded_at"
+    )
+    _FIND_BY_STATUS = f"""
+        SELECT {_COLUMNS} FROM payees
+        WHERE status = ? AND id > ? AND onboarding_attempts < ?
+        ORDER BY id LIMIT ?
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        # Imported here so the in-memory repository, which shares this module,
+        # does not load sqlite3.
+        import sqlite3
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(self._SCHEMA)
+        for index in self._REPLACED_INDEXES:
+            self._connection.execute(f"DROP INDEX IF EXISTS {index}")
+        self._connection.execute(self._STATUS_INDEX)
+        self._connection.commit()
+
+    def save(self, payee: Payee) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT INTO payees ({self._COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                self._to_row(payee),
+            )
+
+    def find_by_id(self, payee_id: UUID) -> Optional[Payee]:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT {self._COLUMNS} FROM payees WHERE id = ?",
+                (payee_id.bytes,),
+            ).fetchone()
+        return self._from_row(row) if row else None
+
     def update(self, payee: Payee) -> None:
-        if payee.id not in self._storage:
+        row = self._to_row(payee)
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                """
+                UPDATE payees
+                SET name = ?, email = ?, bank_account = ?, status = ?,
+                    psp_reference = ?, created_at = ?, updated_at = ?,
+                    onboarding_attempts = ?, onboarded_at = ?
+                WHERE id = ?
+                """,
+                row[1:] + row[:1],
+            )
+        if cursor.rowcount == 0:
             raise ValueError(f"Payee {payee.id} not found")
-        self._storage[payee.id] = payee
+
+    def list_after(self, after_id: Optional[UUID], limit: int) -> List[Payee]:
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {self._COLUMNS} FROM payees WHERE id > ? ORDER BY id LIMIT ?",
+                (after_id.bytes if after_id else b"", limit),
+            ).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def find_by_status(
+        self,
+        status: PayeeStatus,
+        after_id: Optional[UUID],
+        limit: int,
+        max_attempts: Optional[int] = None,
+    ) -> List[Payee]:
+        with self._lock:
+            rows = self._connection.execute(
+                self._FIND_BY_STATUS,
+                (
+                    status.value,
+                    after_id.bytes if after_id else b"",
+                    max_attempts if max_attempts is not None else 2**63 - 1,
+                    limit,
+                ),
+            ).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def _to_row(payee: Payee) -> tuple:
+        return (
+            payee.id.bytes,
+            payee.name,
+            payee.email,
+            payee.bank_account,
+            payee.status.value,
+            payee.psp_reference,
+            payee.created_at.isoformat(),
+            payee.updated_at.isoformat(),
+            payee.onboarding_attempts,
+            payee.onboarded_at.isoformat() if payee.onboarded_at else None,
+        )
+
+    @staticmethod
+    def _from_row(row: tuple) -> Payee:
+        return Payee(
+            id=UUID(bytes=row[0]),
+            name=row[1],
+            email=row[2],
+            bank_account=row[3],
+            status=PayeeStatus(row[4]),
+            psp_reference=row[5],
+            created_at=datetime.fromisoformat(row[6]),
+            updated_at=datetime.fromisoformat(row[7]),
+            onboarding_attempts=row[8],
+            onboarded_at=datetime.fromisoformat(row[9]) if row[9] else None,
+        )
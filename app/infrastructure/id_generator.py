@@ -0,0 +1,74 @@
+import secrets
+import threading
+import time
+from uuid import UUID, uuid4
+
+from app.domain.ports import IdGenerator
+
+
+class UUID4IdGenerator(IdGenerator):
+    def generate(self) -> UUID:
+        return uuid4()
+
+
+class UUID7IdGenerator(IdGenerator):
+    # RFC 9562 UUIDv7: 48-bit Unix millisecond timestamp, then a 12-bit counter in
+    # rand_a that keeps ids monotonic within a millisecond, then 62 random bits.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._counter = 0
+
+    def generate(self) -> UUID:
+        with self._lock:
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                # Random start with headroom, so ids stay unguessable but rarely overflow.
+                self._counter = secrets.randbits(11)
+            else:
+                self._counter += 1
+                if self._counter > 0xFFF:
+                    self._last_ms += 1
+                    self._counter = 0
+            value = (
+                (self._last_ms & 0xFFFF_FFFF_FFFF) << 80
+                | 0x7 << 76
+                | self._counter << 64
+                | 0b10 << 62
+                | secrets.randbits(62)
+            )
+        return UUID(int=value)
+
+
+class SnowflakeIdGenerator(IdGenerator):
+    # Twitter Snowflake layout in a positive int64: 41-bit milliseconds since
+    # ``epoch_ms``, 10-bit worker id and a 12-bit per-millisecond sequence.
+    # ``generate`` embeds the int64 in a UUID so it fits the Payee id type while
+    # keeping its ordering.
+    DEFAULT_EPOCH_MS = 1_704_067_200_000  # 2024-01-01T00:00:00Z
+
+    def __init__(self, worker_id: int = 0, epoch_ms: int = DEFAULT_EPOCH_MS):
+        if not 0 <= worker_id < 1024:
+            raise ValueError("worker_id must be between 0 and 1023")
+        self.worker_id = worker_id
+        self.epoch_ms = epoch_ms
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._sequence = 0
+
+    def next_int(self) -> int:
+        with self._lock:
+            now_ms = max(time.time_ns() // 1_000_000 - self.epoch_ms, self._last_ms)
+            if now_ms == self._last_ms:
+                self._sequence = (self._sequence + 1) & 0xFFF
+                if self._sequence == 0:
+                    while now_ms <= self._last_ms:
+                        now_ms = time.time_ns() // 1_000_000 - self.epoch_ms
+            else:
+                self._sequence = 0
+            self._last_ms = now_ms
+            return now_ms << 22 | self.worker_id << 12 | self._sequence
+
+    def generate(self) -> UUID:
+        return UUID(int=self.next_int())
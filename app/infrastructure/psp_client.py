@@ -1,6 +1,13 @@
+import threading
+from concurrent.futures import Future
+from typing import List, Tuple, Union
 from uuid import uuid4
 
-from app.domain.ports import PSPClient
+from app.domain.ports import PSPClient, PSPPayee
+
+
+class PSPError(Exception):
+    pass
 
 
 class MockPSPClient(PSPClient):
@@ -15,14 +22,125 @@ class MockPSPClient(PSPClient):
 
 
 class HTTPPSPClient(PSPClient):
-    def __init__(self, base_url: str, api_key: str):
+    def __init__(self, base_url: str, api_key: str, timeout: float = 10.0):
         self.base_url = base_url
         self.api_key = api_key
-    
+        # httpx is only needed when this adapter is selected.
+        import httpx
+
+        self._client = httpx.Client(
+            base_url=base_url,
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=timeout,
+        )
+
+    def onboard_payee(
+        self,
+        name: str,
+        email: str,
+        bank_account: str,
+    ) -> str:
+        response = self._client.post(
+            "/payees",
+            json={"name": name, "email": email, "bank_account": bank_account},
+        )
+        if response.is_error:
+            raise PSPError(f"PSP rejected payee: {response.status_code} {response.text}")
+        return response.json()["reference"]
+
+    def onboard_payees(self, payees: List[PSPPayee]) -> List[Union[str, Exception]]:
+        response = self._client.post(
+            "/payees/batch",
+            json={
+                "payees": [
+                    {"name": p.name, "email": p.email, "bank_account": p.bank_account}
+                    for p in payees
+                ]
+            },
+        )
+        if response.is_error:
+            raise PSPError(f"PSP rejected batch: {response.status_code} {response.text}")
+
+        results: List[Union[str, Exception]] = []
+        for item in response.json()["results"]:
+            if "reference" in item:
+                results.append(item["reference"])
+            else:
+                results.append(PSPError(item.get("error", "Unknown PSP error")))
+        return results
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class BatchingPSPClient(PSPClient):
+    """Coalesces concurrent ``onboard_payee`` calls into ``onboard_payees`` batches.
+
+    The first caller to arrive opens a batch and waits up to ``max_wait_seconds``
+    for others to join (or until ``max_batch_size`` is reached), then sends the
+    whole batch to the wrapped client. Every caller blocks until its own entry
+    has been resolved and receives its own reference or error.
+    """
+
+    def __init__(
+        self,
+        psp_client: PSPClient,
+        max_batch_size: int = 50,
+        max_wait_seconds: float = 0.005,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.psp_client = psp_client
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self._condition = threading.Condition()
+        self._open_batch: List[Tuple[PSPPayee, Future]] = []
+
     def onboard_payee(
         self,
         name: str,
         email: str,
         bank_account: str,
     ) -> str:
-        raise NotImplementedError("Replace with actual HTTP implementation")
+        future: Future = Future()
+        payee = PSPPayee(name=name, email=email, bank_account=bank_account)
+
+        with self._condition:
+            batch = self._open_batch
+            batch.append((payee, future))
+            is_leader = len(batch) == 1
+
+            if len(batch) >= self.max_batch_size:
+                self._open_batch = []
+                self._condition.notify_all()
+            elif is_leader:
+                self._condition.wait_for(
+                    lambda: batch is not self._open_batch,
+                    timeout=self.max_wait_seconds,
+                )
+                if batch is self._open_batch:
+                    self._open_batch = []
+
+        if is_leader:
+            self._flush(batch)
+
+        return future.result()
+
+    def onboard_payees(self, payees: List[PSPPayee]) -> List[Union[str, Exception]]:
+        return self.psp_client.onboard_payees(payees)
+
+    def _flush(self, batch: List[Tuple[PSPPayee, Future]]) -> None:
+        try:
+            results = self.psp_client.onboard_payees([payee for payee, _ in batch])
+            if len(results) != len(batch):
+                raise PSPError(
+                    f"PSP returned {len(results)} results for a batch of {len(batch)}"
+                )
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
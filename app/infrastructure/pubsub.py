@@ -1,17 +1,99 @@
-from dataclasses import asdict
+import itertools
+import threading
+import zlib
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from app.domain import PayeeOnboardedEvent
-from app.domain.ports import PublishPayeeOnboardedEvent
+from app.domain import DomainEvent, PayeeOnboardedEvent
+from app.domain.ports import PublishDomainEvent, PublishPayeeOnboardedEvent
+
+
+PAYEE_TOPIC = "payee-topic"
 
 
 class KafkaPublisher:
-    def publish(self, topic: str, event_as_dict: dict) -> None:
+    def publish(self, topic: str, event_as_dict: dict, key: Optional[str] = None) -> None:
         # sends to data
         pass
 
 
+@dataclass(frozen=True)
+class ConsumerRecord:
+    topic: str
+    partition: int
+    offset: int
+    key: Optional[str]
+    value: dict
+
+
+class InMemoryKafkaBroker(KafkaPublisher):
+    # In-process stand-in for a Kafka cluster: keyed messages are routed to a fixed
+    # partition, each partition is an append-only log, and committed offsets are
+    # tracked per consumer group.
+    def __init__(self, partitions: int = 12):
+        if partitions < 1:
+            raise ValueError("partitions must be at least 1")
+        self.partitions = partitions
+        self._logs: Dict[str, List[List[ConsumerRecord]]] = {}
+        self._committed: Dict[Tuple[str, str, int], int] = {}
+        self._round_robin = itertools.count()
+        self._condition = threading.Condition()
+
+    def publish(self, topic: str, event_as_dict: dict, key: Optional[str] = None) -> None:
+        with self._condition:
+            partition = self.partition_for(key)
+            log = self._partition_logs(topic)[partition]
+            log.append(
+                ConsumerRecord(
+                    topic=topic,
+                    partition=partition,
+                    offset=len(log),
+                    key=key,
+                    value=event_as_dict,
+                )
+            )
+            self._condition.notify_all()
+
+    def partition_for(self, key: Optional[str]) -> int:
+        if key is None:
+            return next(self._round_robin) % self.partitions
+        return zlib.crc32(key.encode()) % self.partitions
+
+    def fetch(self, topic: str, partition: int, offset: int, max_records: int) -> List[ConsumerRecord]:
+        with self._condition:
+            return self._partition_logs(topic)[partition][offset:offset + max_records]
+
+    def wait_for_messages(self, timeout: float) -> None:
+        with self._condition:
+            self._condition.wait(timeout)
+
+    def end_offset(self, topic: str, partition: int) -> int:
+        with self._condition:
+            return len(self._partition_logs(topic)[partition])
+
+    def commit(self, group_id: str, topic: str, partition: int, offset: int) -> None:
+        with self._condition:
+            self._committed[(group_id, topic, partition)] = offset
+
+    def committed(self, group_id: str, topic: str, partition: int) -> int:
+        with self._condition:
+            return self._committed.get((group_id, topic, partition), 0)
+
+    def lag(self, group_id: str, topic: str) -> int:
+        with self._condition:
+            return sum(
+                len(log) - self._committed.get((group_id, topic, partition), 0)
+                for partition, log in enumerate(self._partition_logs(topic))
+            )
+
+    def _partition_logs(self, topic: str) -> List[List[ConsumerRecord]]:
+        if topic not in self._logs:
+            self._logs[topic] = [[] for _ in range(self.partitions)]
+        return self._logs[topic]
+
+
 class KafkaPublishPayeeOnboardedEvent(PublishPayeeOnboardedEvent):
     def __init__(
             self,
@@ -21,7 +103,11 @@ class KafkaPublishPayeeOnboardedEvent(PublishPayeeOnboardedEvent):
 
     def execute(self, event: PayeeOnboardedEvent) -> None:
         event_as_dict = self._event_to_dict(event)
-        self.kafka_publisher.publish(topic="payee-topic", event_as_dict=event_as_dict)
+        self.kafka_publisher.publish(
+            topic=PAYEE_TOPIC,
+            event_as_dict=event_as_dict,
+            key=str(event.payee_id),
+        )
 
     def _event_to_dict(self, event: PayeeOnboardedEvent) -> dict:
         data = asdict(event)
@@ -50,6 +136,15 @@ class MockPublishPayeeOnboardedEvent(PublishPayeeOnboardedEvent):
         pass
 
 
+class InMemoryDomainEventBus(PublishDomainEvent):
+    # Synchronous in-process dispatch: subscribers run on the publishing thread,
+    # in subscription order, before execute returns.
+    def __init__(self):
+        self._subscribers: List[Callable[[DomainEvent], None]] = []
 
+    def subscribe(self, handler: Callable[[DomainEvent], None]) -> None:
+        self._subscribers.append(handler)
 
-
+    def execute(self, event: DomainEvent) -> None:
+        for handler in self._subscribers:
+            handler(event)
@@ -0,0 +1,105 @@
+from typing import Any, Callable, Dict, List
+
+from app.config import Settings
+
+AdapterFactory = Callable[[Settings], Any]
+
+
+class AdapterRegistry:
+    """Named adapter factories per port, selected by configuration.
+
+    Each factory imports its adapter module when it is called, so only the
+    adapters a deployment actually selects (and their optional dependencies,
+    such as httpx or sqlite3) are ever loaded.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Dict[str, AdapterFactory]] = {}
+
+    def register(self, port: str, name: str) -> Callable[[AdapterFactory], AdapterFactory]:
+        def decorator(factory: AdapterFactory) -> AdapterFactory:
+            self._factories.setdefault(port, {})[name] = factory
+            return factory
+
+        return decorator
+
+    def names(self, port: str) -> List[str]:
+        return sorted(self._factories.get(port, {}))
+
+    def create(self, port: str, name: str, settings: Settings) -> Any:
+        factory = self._factories.get(port, {}).get(name)
+        if factory is None:
+            raise ValueError(
+                f"Unknown {port} adapter {name!r}, expected one of: {', '.join(self.names(port))}"
+            )
+        return factory(settings)
+
+
+adapters = AdapterRegistry()
+
+
+@adapters.register("payee_repository", "memory")
+def _memory_payee_repository(settings: Settings):
+    from app.infrastructure.database import InMemoryPayeeRepository
+
+    return InMemoryPayeeRepository()
+
+
+@adapters.register("payee_repository", "sqlite")
+def _sqlite_payee_repository(settings: Settings):
+    from app.infrastructure.database import SQLitePayeeRepository
+
+    return SQLitePayeeRepository(settings.database_path)
+
+
+@adapters.register("psp_client", "mock")
+def _mock_psp_client(settings: Settings):
+    from app.infrastructure.psp_client import MockPSPClient
+
+    return MockPSPClient()
+
+
+@adapters.register("psp_client", "http")
+def _http_psp_client(settings: Settings):
+    from app.infrastructure.psp_client import HTTPPSPClient
+
+    return HTTPPSPClient(
+        base_url=settings.psp_base_url,
+        api_key=settings.psp_api_key,
+        timeout=settings.psp_timeout,
+    )
+
+
+@adapters.register("event_publisher", "mock")
+def _mock_event_publisher(settings: Settings):
+    from app.infrastructure.pubsub import MockPublishPayeeOnboardedEvent
+
+    return MockPublishPayeeOnboardedEvent()
+
+
+@adapters.register("event_publisher", "kafka")
+def _kafka_event_publisher(settings: Settings):
+    from app.infrastructure.pubsub import KafkaPublisher, KafkaPublishPayeeOnboardedEvent
+
+    return KafkaPublishPayeeOnboardedEvent(KafkaPublisher())
+
+
+@adapters.register("id_generator", "uuid7")
+def _uuid7_id_generator(settings: Settings):
+    from app.infrastructure.id_generator import UUID7IdGenerator
+
+    return UUID7IdGenerator()
+
+
+@adapters.register("id_generator", "uuid4")
+def _uuid4_id_generator(settings: Settings):
+    from app.infrastructure.id_generator import UUID4IdGenerator
+
+    return UUID4IdGenerator()
+
+
+@adapters.register("id_generator", "snowflake")
+def _snowflake_id_generator(settings: Settings):
+    from app.infrastructure.id_generator import SnowflakeIdGenerator
+
+    return SnowflakeIdGenerator(worker_id=settings.snowflake_worker_id)
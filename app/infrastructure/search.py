@@ -0,0 +1,267 @@
+import heapq
+import math
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from app.domain.model import Payee, PayeeStatus
+from app.domain.ports import PayeeRepository, PayeeSearchHit, PayeeSearchIndex
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def trigrams(text: str) -> Set[str]:
+    # pg_trgm-style: each lowercased word is padded with two leading spaces and one
+    # trailing space, so short words and word starts still produce trigrams.
+    result: Set[str] = set()
+    for word in _WORD.findall(text.lower()):
+        padded = f"  {word} "
+        result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return result
+
+
+def _contains(postings: array, doc: int) -> bool:
+    i = bisect_left(postings, doc)
+    return i < len(postings) and postings[i] == doc
+
+
+class TrigramPayeeSearchIndex(PayeeSearchIndex):
+    """In-memory inverted index from trigrams of payee name and email to payees.
+
+    Payees are numbered densely in indexing order and every posting list is an
+    ``array('I')`` of document numbers, which stays sorted because numbers only
+    ever grow. Re-indexing a payee whose text changed tombstones the old document
+    and appends a new one; tombstones are compacted away once they outnumber live
+    documents.
+
+    A result scores ``shared trigrams / query trigrams`` and must reach
+    ``min_score``. By pigeonhole, any such payee appears in one of the shortest
+    ``len(query) - required + 1`` posting lists, so only those are scanned to
+    find candidates, and the long (common) lists are probed by binary search.
+
+    Between compactions every structure is append-only (tombstoning only clears a
+    ``_live`` flag), so searches take references and the current document count
+    under the lock and count and rank outside it, ignoring documents added since.
+    Compaction likewise builds the new structures off-lock from a snapshot, then
+    applies the changes made meanwhile and swaps them in.
+    """
+
+    def __init__(self, min_score: float = 0.3):
+        self.min_score = min_score
+        self._lock = threading.Lock()
+        self._postings: Dict[str, array] = {}
+        self._doc_payee_ids: List[UUID] = []
+        self._doc_sizes = array("H")
+        self._doc_fingerprints = array("q")
+        self._live = bytearray()
+        self._doc_by_payee: Dict[UUID, int] = {}
+        self._dead = 0
+        # While a compaction is building, changes it has to replay before swapping.
+        self._compacting = False
+        self._added_while_compacting: List[Tuple[int, Set[str]]] = []
+        self._tombstoned_while_compacting: List[int] = []
+
+    def index(self, payee: Payee) -> None:
+        self._index(payee, replace=True)
+
+    def index_if_absent(self, payee: Payee) -> None:
+        # For bulk loading alongside live updates: a payee that a save or update
+        # has already indexed keeps that document, which may be newer than ``payee``.
+        self._index(payee, replace=False)
+
+    def _index(self, payee: Payee, replace: bool) -> None:
+        text = f"{payee.name} {payee.email}"
+        fingerprint = hash(text)
+        grams = trigrams(text)
+        with self._lock:
+            doc = self._doc_by_payee.get(payee.id)
+            if doc is not None:
+                if not replace or self._doc_fingerprints[doc] == fingerprint:
+                    return
+                self._live[doc] = 0
+                self._dead += 1
+                if self._compacting:
+                    self._tombstoned_while_compacting.append(doc)
+
+            doc = len(self._doc_payee_ids)
+            for gram in grams:
+                postings = self._postings.get(gram)
+                if postings is None:
+                    postings = self._postings[gram] = array("I")
+                postings.append(doc)
+            self._doc_payee_ids.append(payee.id)
+            self._doc_sizes.append(min(len(grams), 0xFFFF))
+            self._doc_fingerprints.append(fingerprint)
+            self._live.append(1)
+            self._doc_by_payee[payee.id] = doc
+            if self._compacting:
+                self._added_while_compacting.append((doc, grams))
+
+            compact = not self._compacting and self._dead > len(self._doc_by_payee)
+            if compact:
+                self._compacting = True
+        if compact:
+            self._compact()
+
+    def search(self, query: str, limit: int) -> List[PayeeSearchHit]:
+        grams = trigrams(query)
+        if not grams:
+            return []
+        required = max(1, math.ceil(self.min_score * len(grams) - 1e-9))
+
+        with self._lock:
+            lists = [self._postings.get(gram, array("I")) for gram in grams]
+            payee_ids, sizes, live = self._doc_payee_ids, self._doc_sizes, self._live
+            documents = len(payee_ids)
+
+        # Lists may grow while we read them; appended documents are >= documents.
+        lists.sort(key=len)
+        scan, probe = lists[: len(lists) - required + 1], lists[len(lists) - required + 1:]
+
+        counts: Counter = Counter()
+        for postings in scan:
+            counts.update(postings)
+        for postings in probe:
+            # Binary-search long lists for the few candidates we have; once
+            # candidates are many, counting the whole list is cheaper. Docs first
+            # seen here can reach at most len(probe) < required and are dropped.
+            if len(counts) * 16 < len(postings):
+                for doc in counts:
+                    if _contains(postings, doc):
+                        counts[doc] += 1
+            else:
+                counts.update(postings)
+
+        size_q = len(grams)
+        matches = [
+            (shared, doc)
+            for doc, shared in counts.items()
+            if shared >= required and doc < documents and live[doc]
+        ]
+        # Higher coverage first, then the closer overall match (Jaccard).
+        top = heapq.nlargest(
+            limit,
+            matches,
+            key=lambda match: (match[0], match[0] / (size_q + sizes[match[1]] - match[0])),
+        )
+        return [
+            PayeeSearchHit(payee_id=payee_ids[doc], score=round(shared / size_q, 4))
+            for shared, doc in top
+        ]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "documents": len(self._doc_payee_ids),
+                "live_documents": len(self._doc_by_payee),
+                "trigrams": len(self._postings),
+                "postings": sum(len(p) for p in self._postings.values()),
+                "posting_bytes": sum(p.itemsize * len(p) for p in self._postings.values()),
+            }
+
+    def _compact(self) -> None:
+        try:
+            with self._lock:
+                documents = len(self._doc_payee_ids)
+                live = bytes(self._live)
+                grams = list(self._postings.items())
+
+            remap, postings, payee_ids, sizes, fingerprints = self._rebuild(
+                documents, live, grams
+            )
+            new_live = bytearray(b"\x01") * len(payee_ids)
+            doc_by_payee = {payee_id: doc for doc, payee_id in enumerate(payee_ids)}
+
+            with self._lock:
+                # Replay what was indexed while the new structures were built.
+                dead = 0
+                for doc in self._tombstoned_while_compacting:
+                    if doc < documents:
+                        new_live[remap[doc]] = 0
+                        dead += 1
+                for doc, doc_grams in self._added_while_compacting:
+                    if not self._live[doc]:
+                        continue
+                    new_doc = len(payee_ids)
+                    for gram in doc_grams:
+                        gram_postings = postings.get(gram)
+                        if gram_postings is None:
+                            gram_postings = postings[gram] = array("I")
+                        gram_postings.append(new_doc)
+                    payee_ids.append(self._doc_payee_ids[doc])
+                    sizes.append(self._doc_sizes[doc])
+                    fingerprints.append(self._doc_fingerprints[doc])
+                    new_live.append(1)
+                    doc_by_payee[self._doc_payee_ids[doc]] = new_doc
+
+                self._postings = postings
+                self._doc_payee_ids = payee_ids
+                self._doc_sizes = sizes
+                self._doc_fingerprints = fingerprints
+                self._live = new_live
+                self._doc_by_payee = doc_by_payee
+                self._dead = dead
+        finally:
+            with self._lock:
+                self._compacting = False
+                self._added_while_compacting = []
+                self._tombstoned_while_compacting = []
+
+    def _rebuild(
+        self, documents: int, live: bytes, grams: List[Tuple[str, array]]
+    ) -> Tuple[array, Dict[str, array], List[UUID], array, array]:
+        # Runs without the lock. Only the compacting thread swaps the structures,
+        # and documents below ``documents`` are never modified in place.
+        remap = array("I", [0]) * documents
+        payee_ids: List[UUID] = []
+        sizes = array("H")
+        fingerprints = array("q")
+        for doc in range(documents):
+            if live[doc]:
+                remap[doc] = len(payee_ids)
+                payee_ids.append(self._doc_payee_ids[doc])
+                sizes.append(self._doc_sizes[doc])
+                fingerprints.append(self._doc_fingerprints[doc])
+
+        postings: Dict[str, array] = {}
+        for gram, docs in grams:
+            kept = array(
+                "I", (remap[doc] for doc in docs[: bisect_left(docs, documents)] if live[doc])
+            )
+            if kept:
+                postings[gram] = kept
+        return remap, postings, payee_ids, sizes, fingerprints
+
+
+class SearchIndexingPayeeRepository(PayeeRepository):
+    # Decorates a repository so the search index follows every save and update.
+    def __init__(self, repository: PayeeRepository, search_index: PayeeSearchIndex):
+        self.repository = repository
+        self.search_index = search_index
+
+    def save(self, payee: Payee) -> None:
+        self.repository.save(payee)
+        self.search_index.index(payee)
+
+    def find_by_id(self, payee_id: UUID) -> Optional[Payee]:
+        return self.repository.find_by_id(payee_id)
+
+    def update(self, payee: Payee) -> None:
+        self.repository.update(payee)
+        self.search_index.index(payee)
+
+    def list_after(self, after_id: Optional[UUID], limit: int) -> List[Payee]:
+        return self.repository.list_after(after_id, limit)
+
+    def find_by_status(
+        self,
+        status: PayeeStatus,
+        after_id: Optional[UUID],
+        limit: int,
+        max_attempts: Optional[int] = None,
+    ) -> List[Payee]:
+        return self.repository.find_by_status(status, after_id, limit, max_attempts)
@@ -1,17 +1,31 @@
 from contextlib import asynccontextmanager
+from typing import Optional
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.config import Settings
 from app.ui.rest import router
+from app.ui.rest.container import ServiceContainer
+from app.ui.rest.traffic_capture import TrafficCaptureMiddleware, TrafficRecorder
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    yield
+    app.state.container = ServiceContainer(app.state.settings)
+    try:
+        app.state.container.start()
+        yield
+    finally:
+        app.state.container.close()
+        if app.state.traffic_recorder is not None:
+            app.state.traffic_recorder.close()
 
 
-def create_app() -> FastAPI:
+def create_app(
+    traffic_recorder: Optional[TrafficRecorder] = None,
+    settings: Optional[Settings] = None,
+) -> FastAPI:
     app = FastAPI(
         title="Payee Onboarding Service",
         description=(
@@ -30,20 +44,40 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
+    app.state.settings = settings or Settings.from_env()
+    app.state.container = None
+    app.state.traffic_recorder = traffic_recorder or TrafficRecorder.from_settings(app.state.settings)
+    if app.state.traffic_recorder is not None:
+        app.add_middleware(
+            TrafficCaptureMiddleware,
+            recorder=app.state.traffic_recorder,
+            sample_rate=app.state.settings.traffic_capture_sample_rate,
+        )
+
     app.include_router(router)
     
     @app.get("/health", tags=["health"])
     def health_check():
+        # Search and stats are partial until the read models have warmed up.
+        container = app.state.container
         return {
             "status": "healthy",
             "service": "payee-onboarding",
             "version": "1.0.0",
+            "read_models_ready": container is not None and container.read_models_ready.is_set(),
         }
     
     return app
 
 
-app = create_app()
+def __getattr__(name):
+    # ``app.main:app`` for uvicorn; built on first access so that importing
+    # create_app does not also build an application.
+    if name == "app":
+        global app
+        app = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
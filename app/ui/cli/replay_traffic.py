@@ -0,0 +1,209 @@
+"""
+Replay a captured JSONL traffic file against the service.
+
+    python -m app.ui.cli.replay_traffic capture.jsonl                 # in-process, 1x speed
+    python -m app.ui.cli.replay_traffic capture.jsonl --speed 10      # 10x faster than captured
+    python -m app.ui.cli.replay_traffic capture.jsonl --rate 200 --target http://localhost:8000
+"""
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import httpx
+
+from app.ui.cli.stats import percentile
+
+
+@dataclass
+class ReplayResult:
+    scheduled_at: float
+    latency: float
+    status: Optional[int]
+
+    @property
+    def is_error(self) -> bool:
+        return self.status is None or self.status >= 400
+
+
+@dataclass
+class WindowReport:
+    start: float
+    requests: int
+    throughput: float
+    error_rate: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+@dataclass
+class ReplayReport:
+    requests: int
+    duration: float
+    throughput: float
+    error_rate: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    windows: List[WindowReport]
+
+
+def load_capture(path: str) -> List[dict]:
+    with open(path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    return sorted(records, key=lambda record: record["timestamp"])
+
+
+def schedule(
+    records: Sequence[dict],
+    speed: float = 1.0,
+    rate: Optional[float] = None,
+) -> List[float]:
+    # Returns the send time of each record, in seconds from the start of the replay.
+    if rate is not None:
+        return [i / rate for i in range(len(records))]
+    if not records:
+        return []
+    first = records[0]["timestamp"]
+    return [(record["timestamp"] - first) / speed for record in records]
+
+
+def replay(
+    client: httpx.Client,
+    records: Sequence[dict],
+    offsets: Sequence[float],
+    concurrency: int = 64,
+) -> List[ReplayResult]:
+    # Open-loop: requests are sent on schedule whether or not earlier ones have
+    # completed, and latency is measured from the scheduled send time so queueing
+    # delay under overload shows up in the percentiles.
+    start = time.perf_counter()
+
+    def send(record: dict, offset: float) -> ReplayResult:
+        try:
+            response = client.request(record["method"], record["path"], json=record.get("body"))
+            status = response.status_code
+        except httpx.HTTPError:
+            status = None
+        return ReplayResult(
+            scheduled_at=offset,
+            latency=time.perf_counter() - start - offset,
+            status=status,
+        )
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = []
+        for record, offset in zip(records, offsets):
+            delay = start + offset - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            futures.append(pool.submit(send, record, offset))
+        return [future.result() for future in futures]
+
+
+def summarize(results: Sequence[ReplayResult], window: float = 1.0) -> ReplayReport:
+    duration = max((r.scheduled_at + r.latency for r in results), default=0.0)
+    buckets: dict = {}
+    for result in results:
+        buckets.setdefault(int(result.scheduled_at // window), []).append(result)
+
+    def stats(group: Sequence[ReplayResult]):
+        latencies = [r.latency * 1000 for r in group]
+        errors = sum(r.is_error for r in group)
+        return (
+            errors / len(group) if group else 0.0,
+            percentile(latencies, 50),
+            percentile(latencies, 95),
+            percentile(latencies, 99),
+        )
+
+    windows = []
+    for index in sorted(buckets):
+        group = buckets[index]
+        error_rate, p50, p95, p99 = stats(group)
+        # The last window usually ends before a full window has elapsed.
+        span = min(window, duration - index * window)
+        windows.append(
+            WindowReport(
+                start=index * window,
+                requests=len(group),
+                throughput=len(group) / span if span > 0 else 0.0,
+                error_rate=error_rate,
+                p50_ms=p50,
+                p95_ms=p95,
+                p99_ms=p99,
+            )
+        )
+
+    error_rate, p50, p95, p99 = stats(results)
+    return ReplayReport(
+        requests=len(results),
+        duration=duration,
+        throughput=len(results) / duration if duration else 0.0,
+        error_rate=error_rate,
+        p50_ms=p50,
+        p95_ms=p95,
+        p99_ms=p99,
+        windows=windows,
+    )
+
+
+def print_report(report: ReplayReport, out=None) -> None:
+    out = out or sys.stdout
+    print(f"{'t(s)':>8} {'reqs':>6} {'req/s':>8} {'err%':>6} {'p50ms':>8} {'p95ms':>8} {'p99ms':>8}", file=out)
+    for w in report.windows:
+        print(
+            f"{w.start:>8.1f} {w.requests:>6} {w.throughput:>8.1f} {w.error_rate * 100:>6.1f} "
+            f"{w.p50_ms:>8.1f} {w.p95_ms:>8.1f} {w.p99_ms:>8.1f}",
+            file=out,
+        )
+    print(
+        f"total: {report.requests} requests in {report.duration:.2f}s "
+        f"({report.throughput:.1f} req/s), errors {report.error_rate * 100:.1f}%, "
+        f"p50 {report.p50_ms:.1f}ms p95 {report.p95_ms:.1f}ms p99 {report.p99_ms:.1f}ms",
+        file=out,
+    )
+
+
+def positive_float(value: str) -> float:
+    number = float(value)
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay captured onboarding traffic.")
+    parser.add_argument("capture", help="JSONL file written by the traffic capture middleware")
+    parser.add_argument("--target", help="base URL of a running server (default: in-process create_app())")
+    pacing = parser.add_mutually_exclusive_group()
+    pacing.add_argument("--speed", type=positive_float, default=1.0, help="replay speed multiplier (default: 1x)")
+    pacing.add_argument("--rate", type=positive_float, help="fixed open-loop rate in requests per second")
+    parser.add_argument("--concurrency", type=int, default=64, help="maximum in-flight requests")
+    parser.add_argument("--window", type=positive_float, default=1.0, help="report window in seconds")
+    args = parser.parse_args(argv)
+
+    records = load_capture(args.capture)
+    offsets = schedule(records, speed=args.speed, rate=args.rate)
+
+    if args.target:
+        with httpx.Client(base_url=args.target) as client:
+            results = replay(client, records, offsets, args.concurrency)
+    else:
+        from fastapi.testclient import TestClient
+
+        from app.main import create_app
+
+        with TestClient(create_app()) as client:
+            results = replay(client, records, offsets, args.concurrency)
+
+    print_report(summarize(results, window=args.window))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
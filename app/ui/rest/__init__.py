@@ -1,3 +1,11 @@
-from app.ui.rest.payee_routes import router
-
 __all__ = ["router"]
+
+
+def __getattr__(name):
+    # Loaded on first use so that importing a submodule such as traffic_capture
+    # does not pull in FastAPI and the routes.
+    if name == "router":
+        from app.ui.rest.payee_routes import router
+
+        return router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,155 @@
+import logging
+import threading
+from typing import Any, Callable, List, Optional
+
+from app.application.list_payees import ListPayeesService
+from app.application.onboard_payee import OnboardPayeeService
+from app.application.payee_stats import PayeeStatsProjection, RebuildPayeeStatsService
+from app.application.retry_failed_payee import RetryFailedPayeeService
+from app.application.search_payees import SearchPayeesService
+from app.config import Settings
+from app.infrastructure.psp_client import BatchingPSPClient
+from app.infrastructure.pubsub import InMemoryDomainEventBus
+from app.infrastructure.registry import AdapterRegistry, adapters
+from app.infrastructure.search import SearchIndexingPayeeRepository, TrigramPayeeSearchIndex
+from app.ui.workers.retry_scheduler import FailedPayeeRetryScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceContainer:
+    """The application's service graph, built once from ``Settings``.
+
+    Adapters are created through the registry, so only the selected ones are
+    imported. Adapters with a ``close`` method and started workers register a
+    shutdown hook; ``close`` runs the hooks in reverse order, so workers stop
+    before the adapters they use are closed.
+    """
+
+    def __init__(self, settings: Settings, registry: AdapterRegistry = adapters):
+        self.settings = settings
+        self.read_models_ready = threading.Event()
+        self._shutdown_hooks: List[Callable[[], None]] = []
+        self._stopping = threading.Event()
+        self._warmer: Optional[threading.Thread] = None
+
+        self.search_index = TrigramPayeeSearchIndex()
+        self.payee_repository = SearchIndexingPayeeRepository(
+            repository=self._adapter(registry, "payee_repository", settings.payee_repository),
+            search_index=self.search_index,
+        )
+        self.psp_client = self._adapter(registry, "psp_client", settings.psp_client)
+        if settings.psp_batching:
+            self.psp_client = BatchingPSPClient(
+                self.psp_client,
+                max_batch_size=settings.psp_max_batch_size,
+                max_wait_seconds=settings.psp_max_wait_seconds,
+            )
+        self.payee_onboarded_event_publisher = self._adapter(
+            registry, "event_publisher", settings.event_publisher
+        )
+        self.id_generator = self._adapter(registry, "id_generator", settings.id_generator)
+
+        self.domain_event_bus = InMemoryDomainEventBus()
+        self.payee_stats_projection = PayeeStatsProjection()
+        self.domain_event_bus.subscribe(self.payee_stats_projection.handle)
+
+        self.onboard_payee_service = OnboardPayeeService(
+            repository=self.payee_repository,
+            psp_client=self.psp_client,
+            publish_payee_onboarded_event=self.payee_onboarded_event_publisher,
+            id_generator=self.id_generator,
+            publish_domain_event=self.domain_event_bus,
+        )
+        self.list_payees_service = ListPayeesService(repository=self.payee_repository)
+        self.search_payees_service = SearchPayeesService(
+            search_index=self.search_index,
+            repository=self.payee_repository,
+        )
+        self.retry_failed_payee_service = RetryFailedPayeeService(
+            repository=self.payee_repository,
+            onboard_payee_service=self.onboard_payee_service,
+        )
+        self.rebuild_payee_stats_service = RebuildPayeeStatsService(
+            repository=self.payee_repository,
+            projection=self.payee_stats_projection,
+        )
+        self.retry_scheduler = FailedPayeeRetryScheduler(
+            repository=self.payee_repository,
+            retry_service=self.retry_failed_payee_service,
+        )
+
+    def start(self) -> None:
+        # The read models (search index, stats) live in memory and must be
+        # caught up with whatever the repository already holds. That is a full
+        # scan, so by default it runs in the background and does not delay the
+        # first request; until it finishes, search and stats cover only part
+        # of the existing payees.
+        warmup = self.settings.read_model_warmup
+        if warmup == "sync":
+            self.warm_read_models()
+        elif warmup == "background":
+            self._warmer = threading.Thread(
+                target=self.warm_read_models, name="read-model-warmup", daemon=True
+            )
+            self._warmer.start()
+            self._shutdown_hooks.append(self._stop_warming)
+        elif warmup == "off":
+            self.read_models_ready.set()
+        else:
+            raise ValueError(
+                f"Unknown read model warmup {warmup!r}, expected one of: background, off, sync"
+            )
+        if self.settings.retry_scheduler_enabled:
+            self.retry_scheduler.start()
+            self._shutdown_hooks.append(self.retry_scheduler.stop)
+
+    def warm_read_models(self, batch_size: int = 1000) -> None:
+        try:
+            cursor = None
+            while not self._stopping.is_set():
+                payees = self.payee_repository.list_after(cursor, batch_size)
+                if not payees:
+                    break
+                for payee in payees:
+                    # Live saves and updates may already have indexed a newer version.
+                    self.search_index.index_if_absent(payee)
+                cursor = payees[-1].id
+            if not self._stopping.is_set():
+                self.rebuild_payee_stats_service.execute()
+        except Exception:
+            logger.exception("Warming read models failed")
+        finally:
+            self.read_models_ready.set()
+
+    def close(self) -> None:
+        while self._shutdown_hooks:
+            hook = self._shutdown_hooks.pop()
+            try:
+                hook()
+            except Exception:
+                logger.exception("Shutdown hook %r failed", hook)
+
+    def _stop_warming(self) -> None:
+        self._stopping.set()
+        if self._warmer is not None:
+            self._warmer.join()
+
+    def _adapter(self, registry: AdapterRegistry, port: str, name: str) -> Any:
+        adapter = registry.create(port, name, self.settings)
+        close = getattr(adapter, "close", None)
+        if callable(close):
+            self._shutdown_hooks.append(close)
+        return adapter
+
+
+def container_for(app) -> ServiceContainer:
+    # The lifespan builds, starts and closes the container, so an app served
+    # without it (e.g. a TestClient used outside a ``with`` block) has none.
+    container = app.state.container
+    if container is None:
+        raise RuntimeError(
+            "The service container is not running; serve the app with its lifespan, "
+            "e.g. `with TestClient(app) as client:`"
+        )
+    return container
@@ -1,29 +1,54 @@
-from functools import lru_cache
+from fastapi import Depends, Request
 
+from app.application.list_payees import ListPayeesService
 from app.application.onboard_payee import OnboardPayeeService
-from app.infrastructure.database import InMemoryPayeeRepository
-from app.infrastructure.psp_client import MockPSPClient
-from app.infrastructure.pubsub import MockPublishPayeeOnboardedEvent
+from app.application.payee_stats import PayeeStatsProjection, RebuildPayeeStatsService
+from app.application.retry_failed_payee import RetryFailedPayeeService
+from app.application.search_payees import SearchPayeesService
+from app.ui.rest.container import ServiceContainer, container_for
 
 
-@lru_cache
-def get_payee_repository():
-    return InMemoryPayeeRepository()
+def get_container(request: Request) -> ServiceContainer:
+    return container_for(request.app)
 
 
-@lru_cache
-def get_psp_client():
-    return MockPSPClient()
+def get_onboard_payee_service(
+    container: ServiceContainer = Depends(get_container),
+) -> OnboardPayeeService:
+    return container.onboard_payee_service
 
 
-@lru_cache
-def get_payee_onboarded_event_publisher():
-    return MockPublishPayeeOnboardedEvent()
+def get_list_payees_service(
+    container: ServiceContainer = Depends(get_container),
+) -> ListPayeesService:
+    return container.list_payees_service
 
 
-def get_onboard_payee_service() -> OnboardPayeeService:
-    return OnboardPayeeService(
-        repository=get_payee_repository(),
-        psp_client=get_psp_client(),
-        publish_payee_onboarded_event=get_payee_onboarded_event_publisher(),
-    )
+def get_search_payees_service(
+    container: ServiceContainer = Depends(get_container),
+) -> SearchPayeesService:
+    return container.search_payees_service
+
+
+def get_payee_stats_projection(
+    container: ServiceContainer = Depends(get_container),
+) -> PayeeStatsProjection:
+    return container.payee_stats_projection
+
+
+def get_read_models_ready(
+    container: ServiceContainer = Depends(get_container),
+) -> bool:
+    return container.read_models_ready.is_set()
+
+
+def get_rebuild_payee_stats_service(
+    container: ServiceContainer = Depends(get_container),
+) -> RebuildPayeeStatsService:
+    return container.rebuild_payee_stats_service
+
+
+def get_retry_failed_payee_service(
+    container: ServiceContainer = Depends(get_container),
+) -> RetryFailedPayeeService:
+    return container.retry_failed_payee_service
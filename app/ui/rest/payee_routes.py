@@ -1,16 +1,85 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.application.dtos import (
     OnboardPayeeRequest,
+    PayeeListResponse,
     PayeeResponse,
+    PayeeSearchResponse,
+    PayeeStatsResponse,
 )
+from app.application.list_payees import ListPayeesService
 from app.application.onboard_payee import OnboardPayeeService
+from app.application.payee_stats import PayeeStatsProjection, RebuildPayeeStatsService
+from app.application.search_payees import SearchPayeesService
 from app.domain.exceptions import DomainException
-from app.ui.rest.dependencies import get_onboard_payee_service
+from app.ui.rest.dependencies import (
+    get_list_payees_service,
+    get_onboard_payee_service,
+    get_payee_stats_projection,
+    get_read_models_ready,
+    get_rebuild_payee_stats_service,
+    get_search_payees_service,
+)
 
 router = APIRouter(prefix="/api/payees", tags=["payees"])
 
 
+@router.get(
+    "",
+    response_model=PayeeListResponse,
+    summary="List payees in creation order",
+    description="Returns payees created after the `after` cursor. Pass `next_cursor` from a response to get the next page",
+)
+def list_payees(
+    after: Optional[UUID] = Query(None, description="Return payees created after this payee id"),
+    limit: int = Query(50, ge=1, le=500),
+    service: ListPayeesService = Depends(get_list_payees_service),
+) -> PayeeListResponse:
+    return service.execute(after=after, limit=limit)
+
+
+@router.get(
+    "/search",
+    response_model=PayeeSearchResponse,
+    summary="Search payees by name or email",
+    description="Fuzzy search over payee name and email, tolerant of partial and misspelled queries. Results are ranked by score",
+)
+def search_payees(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    service: SearchPayeesService = Depends(get_search_payees_service),
+) -> PayeeSearchResponse:
+    return service.execute(query=q, limit=limit)
+
+
+@router.get(
+    "/stats",
+    response_model=PayeeStatsResponse,
+    summary="Get payee statistics",
+    description="Counts per status, onboardings per hour and the latest onboarded payees, served from a read model kept up to date by domain events. `ready` is false until the read model has caught up with the repository at startup",
+)
+def get_payee_stats(
+    projection: PayeeStatsProjection = Depends(get_payee_stats_projection),
+    ready: bool = Depends(get_read_models_ready),
+) -> PayeeStatsResponse:
+    return projection.snapshot().model_copy(update={"ready": ready})
+
+
+@router.post(
+    "/stats/rebuild",
+    response_model=PayeeStatsResponse,
+    summary="Rebuild payee statistics",
+    description="Recomputes the statistics read model from the repository",
+)
+def rebuild_payee_stats(
+    service: RebuildPayeeStatsService = Depends(get_rebuild_payee_stats_service),
+) -> PayeeStatsResponse:
+    return service.execute()
+
+
 @router.post(
     "",
     response_model=PayeeResponse,
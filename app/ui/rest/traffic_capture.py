@@ -0,0 +1,163 @@
+import hashlib
+import hmac
+import json
+import queue
+import random
+import secrets
+import threading
+import time
+from typing import Iterable, Optional, Tuple
+
+from app.config import Settings
+
+PII_FIELDS = ("name", "email", "bank_account")
+
+_STOP = object()
+
+
+class TrafficRecorder:
+    """Appends scrubbed request records to a JSONL capture file.
+
+    PII is replaced with keyed hashes, so the same person maps to the same
+    pseudonym within a capture (preserving cardinality and repeat patterns)
+    without the original values being recoverable. Pass a fixed ``salt`` to keep
+    pseudonyms stable across captures.
+
+    ``record`` runs on the request path, so it only enqueues; a writer thread
+    scrubs, serialises and writes. If the writer falls more than
+    ``max_pending`` records behind, new records are dropped and counted in
+    ``dropped`` rather than slowing requests down.
+    """
+
+    def __init__(self, path: str, salt: Optional[str] = None, max_pending: int = 10_000):
+        self.path = path
+        self.dropped = 0
+        self._salt = (salt or secrets.token_hex(16)).encode()
+        self._file = open(path, "a", encoding="utf-8")
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._writer = threading.Thread(
+            target=self._write_loop, name="traffic-capture-writer", daemon=True
+        )
+        self._writer.start()
+
+    def record(
+        self,
+        timestamp: float,
+        method: str,
+        path: str,
+        body: bytes,
+        status: Optional[int],
+        duration_ms: float,
+    ) -> None:
+        try:
+            self._queue.put_nowait((timestamp, method, path, body, status, duration_ms))
+        except queue.Full:
+            self.dropped += 1
+
+    def scrub(self, body: bytes) -> Optional[dict]:
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return None
+        if not isinstance(payload, dict):
+            return None
+
+        scrubbed = dict(payload)
+        for field in PII_FIELDS:
+            value = scrubbed.get(field)
+            if isinstance(value, str):
+                scrubbed[field] = self._pseudonymise(field, value)
+        return scrubbed
+
+    def close(self) -> None:
+        # Writes out everything recorded so far before closing the file.
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        self._file.close()
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            timestamp, method, path, body, status, duration_ms = item
+            entry = {
+                "timestamp": timestamp,
+                "method": method,
+                "path": path,
+                "body": self.scrub(body),
+                "status": status,
+                "duration_ms": round(duration_ms, 3),
+            }
+            self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            # Flush once the backlog is drained instead of after every line.
+            if self._queue.empty():
+                self._file.flush()
+
+    def _pseudonymise(self, field: str, value: str) -> str:
+        digest = hmac.new(self._salt, f"{field}:{value}".encode(), hashlib.sha256).hexdigest()
+        if field == "email":
+            return f"user-{digest[:12]}@example.com"
+        if field == "bank_account":
+            # Keep the country prefix and length so replayed payloads look realistic.
+            digits = str(int(digest, 16))
+            return value[:2] + digits[: max(len(value) - 2, 0)]
+        return f"Payee {digest[:12]}"
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> Optional["TrafficRecorder"]:
+        if not settings.traffic_capture_path:
+            return None
+        return cls(settings.traffic_capture_path, salt=settings.traffic_capture_salt)
+
+
+class TrafficCaptureMiddleware:
+    def __init__(
+        self,
+        app,
+        recorder: TrafficRecorder,
+        sample_rate: float = 1.0,
+        routes: Iterable[Tuple[str, str]] = (("POST", "/api/payees"),),
+    ):
+        self.app = app
+        self.recorder = recorder
+        self.sample_rate = sample_rate
+        self.routes = set(routes)
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or (scope["method"], scope["path"]) not in self.routes
+            or random.random() >= self.sample_rate
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        chunks = []
+        response = {"status": None}
+
+        async def capture_receive():
+            message = await receive()
+            if message["type"] == "http.request":
+                chunks.append(message.get("body", b""))
+            return message
+
+        async def capture_send(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+            await send(message)
+
+        timestamp = time.time()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, capture_receive, capture_send)
+        finally:
+            self.recorder.record(
+                timestamp=timestamp,
+                method=scope["method"],
+                path=scope["path"],
+                body=b"".join(chunks),
+                status=response["status"],
+                duration_ms=(time.perf_counter() - started) * 1000,
+            )
@@ -0,0 +1,182 @@
+import heapq
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Set, Tuple
+from uuid import UUID
+
+from app.application.retry_failed_payee import RetryFailedPayeeService
+from app.domain.exceptions import DomainException
+from app.domain.model import PayeeStatus
+from app.domain.ports import PayeeRepository
+
+logger = logging.getLogger(__name__)
+
+
+class FailedPayeeRetryScheduler:
+    """Retries FAILED payees against the PSP with exponential backoff and jitter.
+
+    ``scan`` pages through FAILED payees with the repository's status index and
+    puts each one on a min-heap keyed by its due time. The dispatcher sleeps until
+    the earliest due time, rather than polling every record, and hands due
+    payees to at most ``max_concurrency`` workers. Delays use "full jitter"
+    (uniform in ``[0, min(max_delay, base_delay * 2**attempts))``), so a burst of
+    failures after an outage is spread out instead of retried in lockstep.
+    """
+
+    def __init__(
+        self,
+        repository: PayeeRepository,
+        retry_service: RetryFailedPayeeService,
+        max_concurrency: int = 8,
+        batch_size: int = 500,
+        base_delay: float = 1.0,
+        max_delay: float = 300.0,
+        max_attempts: int = 10,
+        scan_interval: float = 30.0,
+        rng: Optional[random.Random] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.repository = repository
+        self.retry_service = retry_service
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self.scan_interval = scan_interval
+        self.recovered = 0
+        self.gave_up = 0
+        self._rng = rng or random.Random()
+        self._heap: List[Tuple[float, int, UUID]] = []
+        self._sequence = 0
+        self._tracked: Set[UUID] = set()
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._stopping = threading.Event()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def backoff(self, attempts: int) -> float:
+        return self._rng.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempts))
+
+    def scan(self) -> int:
+        scheduled = 0
+        cursor = None
+        while True:
+            # Payees that used up their attempts stay FAILED but are excluded by
+            # the query, so they are not re-read on every scan.
+            batch = self.repository.find_by_status(
+                PayeeStatus.FAILED, cursor, self.batch_size, max_attempts=self.max_attempts
+            )
+            if not batch:
+                return scheduled
+            for payee in batch:
+                if self._schedule(payee.id, self.backoff(payee.onboarding_attempts)):
+                    scheduled += 1
+            cursor = batch[-1].id
+
+    @property
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._heap) + self._in_flight
+
+    def start(self) -> None:
+        if self._thread is not None:
+            raise RuntimeError("Scheduler already started")
+        self._stopping.clear()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="payee-retry"
+        )
+        self._thread = threading.Thread(target=self._run, name="payee-retry-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stopping.set()
+        with self._condition:
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def wait_until_idle(self, timeout: float = 10.0) -> bool:
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while self._heap or self._in_flight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def _schedule(self, payee_id: UUID, delay: float) -> bool:
+        with self._condition:
+            if payee_id in self._tracked:
+                return False
+            self._tracked.add(payee_id)
+            self._push(payee_id, delay)
+            return True
+
+    def _push(self, payee_id: UUID, delay: float) -> None:
+        self._sequence += 1
+        heapq.heappush(self._heap, (time.monotonic() + delay, self._sequence, payee_id))
+        self._condition.notify_all()
+
+    def _run(self) -> None:
+        next_scan = time.monotonic()
+        while not self._stopping.is_set():
+            if time.monotonic() >= next_scan:
+                try:
+                    self.scan()
+                except Exception:
+                    logger.exception("Scanning FAILED payees failed")
+                next_scan = time.monotonic() + self.scan_interval
+
+            with self._condition:
+                now = time.monotonic()
+                if self._heap and self._heap[0][0] <= now and self._in_flight < self.max_concurrency:
+                    _, _, payee_id = heapq.heappop(self._heap)
+                    self._in_flight += 1
+                    self._executor.submit(self._retry, payee_id)
+                    continue
+
+                if self._in_flight >= self.max_concurrency or not self._heap:
+                    wake_at = next_scan
+                else:
+                    wake_at = min(self._heap[0][0], next_scan)
+                self._condition.wait(max(0.0, wake_at - now))
+
+    def _retry(self, payee_id: UUID) -> None:
+        retry_in = None
+        try:
+            self.retry_service.execute(payee_id)
+            outcome = "recovered"
+        except DomainException:
+            # Not found or no longer FAILED: someone else already dealt with it.
+            outcome = None
+        except Exception:
+            payee = self.repository.find_by_id(payee_id)
+            if payee is not None and payee.onboarding_attempts < self.max_attempts:
+                retry_in = self.backoff(payee.onboarding_attempts)
+                outcome = None
+            else:
+                logger.warning("Giving up on payee %s after %s attempts", payee_id, self.max_attempts)
+                outcome = "gave_up"
+
+        with self._condition:
+            self._in_flight -= 1
+            if outcome == "recovered":
+                self.recovered += 1
+            elif outcome == "gave_up":
+                self.gave_up += 1
+            if retry_in is not None:
+                self._push(payee_id, retry_in)
+            else:
+                self._tracked.discard(payee_id)
+            self._condition.notify_all()
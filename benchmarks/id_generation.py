@@ -0,0 +1,112 @@
+"""
+Benchmark insert throughput and primary-key B-tree size for uuid4, UUIDv7 and
+Snowflake ids on the SQLite and in-memory repositories.
+
+    python -m benchmarks.id_generation --payees 200000
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from app.domain.model import Payee, PayeeStatus
+from app.infrastructure.database import InMemoryPayeeRepository, SQLitePayeeRepository
+from app.infrastructure.id_generator import (
+    SnowflakeIdGenerator,
+    UUID4IdGenerator,
+    UUID7IdGenerator,
+)
+
+GENERATORS = {
+    "uuid4": UUID4IdGenerator,
+    "uuid7": UUID7IdGenerator,
+    "snowflake": SnowflakeIdGenerator,
+}
+
+
+def make_payees(id_generator, count):
+    now = datetime.utcnow()
+    return [
+        Payee(
+            id=id_generator.generate(),
+            name=f"Payee {i}",
+            email=f"payee{i}@example.com",
+            bank_account="GB29NWBK60161331926819",
+            status=PayeeStatus.PENDING,
+            psp_reference=None,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def btree_stats(repository):
+    # One row per B-tree of the payees table: the table itself (its primary key,
+    # as it is WITHOUT ROWID) and every secondary index, e.g. the status index.
+    repository._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    rows = repository._connection.execute(
+        """
+        SELECT name, COUNT(*), SUM(pgsize), SUM(unused) FROM dbstat
+        WHERE name IN (SELECT name FROM sqlite_master WHERE tbl_name = 'payees')
+        GROUP BY name ORDER BY name
+        """
+    ).fetchall()
+    return {name: (pages, size, 1 - unused / size) for name, pages, size, unused in rows}
+
+
+def bench_sqlite(name, payees, directory):
+    repository = SQLitePayeeRepository(os.path.join(directory, f"{name}.db"))
+    started = time.perf_counter()
+    for payee in payees:
+        repository.save(payee)
+    elapsed = time.perf_counter() - started
+
+    scan_started = time.perf_counter()
+    cursor, scanned = None, 0
+    while True:
+        page = repository.list_after(cursor, 1000)
+        if not page:
+            break
+        scanned += len(page)
+        cursor = page[-1].id
+    scan_elapsed = time.perf_counter() - scan_started
+
+    btrees = btree_stats(repository)
+    repository.close()
+    total_size = sum(size for _, size, _ in btrees.values())
+    print(
+        f"sqlite    {name:<10} inserts/s={len(payees) / elapsed:>9,.0f} "
+        f"total_size={total_size / 1e6:>7.1f}MB "
+        f"cursor_scan={scanned / scan_elapsed:>10,.0f} rows/s"
+    )
+    for btree, (pages, size, fill) in btrees.items():
+        print(
+            f"            {btree:<20} pages={pages:>7,} size={size / 1e6:>7.1f}MB page_fill={fill:>5.1%}"
+        )
+
+
+def bench_memory(name, payees):
+    repository = InMemoryPayeeRepository()
+    started = time.perf_counter()
+    for payee in payees:
+        repository.save(payee)
+    elapsed = time.perf_counter() - started
+    print(f"in-memory {name:<10} inserts/s={len(payees) / elapsed:>9,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--payees", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, generator in GENERATORS.items():
+            payees = make_payees(generator(), args.payees)
+            bench_sqlite(name, payees, directory)
+            bench_memory(name, payees)
+
+
+if __name__ == "__main__":
+    main()
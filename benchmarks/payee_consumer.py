@@ -0,0 +1,80 @@
+"""
+Benchmark payee-topic consumer throughput by worker count against the
+in-process broker.
+
+    python -m benchmarks.payee_consumer --events 20000 --workers 1 2 4 8
+"""
+import argparse
+import time
+from datetime import datetime
+from uuid import uuid4
+
+from app.domain.events import PayeeOnboardedEvent
+from app.infrastructure.consumer import PartitionedConsumer
+from app.infrastructure.pubsub import (
+    PAYEE_TOPIC,
+    InMemoryKafkaBroker,
+    KafkaPublishPayeeOnboardedEvent,
+)
+
+
+def publish_events(broker, events, payees):
+    publisher = KafkaPublishPayeeOnboardedEvent(kafka_publisher=broker)
+    payee_ids = [uuid4() for _ in range(payees)]
+    for i in range(events):
+        publisher.execute(
+            PayeeOnboardedEvent.create(
+                payee_id=payee_ids[i % payees],
+                name=f"Payee {i}",
+                email=f"payee{i}@example.com",
+                psp_reference=f"PSP-{i}",
+                timestamp=datetime.utcnow(),
+            )
+        )
+
+
+def make_handler(batch_cost, record_cost):
+    # Simulates an I/O-bound downstream call: a fixed round-trip per batch plus a
+    # small per-record cost.
+    def handler(records):
+        time.sleep(batch_cost + record_cost * len(records))
+
+    return handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--payees", type=int, default=2000)
+    parser.add_argument("--partitions", type=int, default=16)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--max-batch-size", type=int, default=100)
+    parser.add_argument("--batch-cost", type=float, default=0.002, help="seconds per handler call")
+    parser.add_argument("--record-cost", type=float, default=0.00005, help="seconds per record")
+    args = parser.parse_args()
+
+    broker = InMemoryKafkaBroker(partitions=args.partitions)
+    publish_events(broker, args.events, args.payees)
+
+    for workers in args.workers:
+        consumer = PartitionedConsumer(
+            broker,
+            PAYEE_TOPIC,
+            group_id=f"bench-{workers}",
+            handler=make_handler(args.batch_cost, args.record_cost),
+            workers=workers,
+            max_batch_size=args.max_batch_size,
+        )
+        started = time.perf_counter()
+        consumer.start()
+        consumer.wait_until_caught_up(timeout=600)
+        elapsed = time.perf_counter() - started
+        consumer.stop()
+        print(
+            f"workers={workers:<3} events={consumer.processed} "
+            f"elapsed={elapsed:.2f}s throughput={consumer.processed / elapsed:,.0f} events/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
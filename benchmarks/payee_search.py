@@ -0,0 +1,115 @@
+"""
+Benchmark trigram search index build time, memory and query latency.
+
+    python -m benchmarks.payee_search --payees 1000000
+"""
+import argparse
+import random
+import resource
+import time
+from datetime import datetime
+
+from app.domain.model import Payee, PayeeStatus
+from app.infrastructure.id_generator import UUID7IdGenerator
+from app.infrastructure.search import TrigramPayeeSearchIndex
+from benchmarks.stats import format_latencies
+
+FIRST_NAMES = [
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda",
+    "David", "Elizabeth", "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+    "Thomas", "Sarah", "Charles", "Karen", "Mohammed", "Aisha", "Wei", "Yuki",
+    "Giulia", "Mateo", "Sofia", "Lukas", "Emma", "Noah", "Olivia", "Liam",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
+    "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson",
+    "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson", "Walker",
+    "Young", "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill", "Flores",
+]
+DOMAINS = ["example.com", "mail.com", "acme.io", "corp.co.uk", "payees.net"]
+
+
+def make_payees(count, rng):
+    id_generator = UUID7IdGenerator()
+    now = datetime.utcnow()
+    payees = []
+    for i in range(count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        # A generated surname suffix keeps names distinct at scale.
+        suffix = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(5))
+        payees.append(
+            Payee(
+                id=id_generator.generate(),
+                name=f"{first} {last}{suffix}",
+                email=f"{first[0].lower()}.{last.lower()}{suffix}{i % 1000}@{rng.choice(DOMAINS)}",
+                bank_account="GB29NWBK60161331926819",
+                status=PayeeStatus.ACTIVE,
+                psp_reference=None,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+    return payees
+
+
+def misspell(text, rng):
+    chars = list(text)
+    i = rng.randrange(1, len(chars) - 1)
+    operation = rng.choice(["swap", "drop", "replace"])
+    if operation == "swap":
+        chars[i], chars[i + 1] = chars[i + 1], chars[i]
+    elif operation == "drop":
+        del chars[i]
+    else:
+        chars[i] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+    return "".join(chars)
+
+
+def rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--payees", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    payees = make_payees(args.payees, rng)
+
+    index = TrigramPayeeSearchIndex()
+    rss_before = rss_mb()
+    started = time.perf_counter()
+    for payee in payees:
+        index.index(payee)
+    build = time.perf_counter() - started
+    rss_after = rss_mb()
+
+    stats = index.stats()
+    print(
+        f"payees={args.payees:,} build={build:.1f}s ({args.payees / build:,.0f}/s) "
+        f"trigrams={stats['trigrams']:,} postings={stats['postings']:,} "
+        f"posting_lists={stats['posting_bytes'] / 1e6:.1f}MB index_rss~{rss_after - rss_before:.0f}MB"
+    )
+
+    for label, make_query in [
+        ("exact name", lambda p: p.name),
+        ("misspelled name", lambda p: misspell(p.name, rng)),
+        ("partial email", lambda p: p.email.split("@")[0][:12]),
+    ]:
+        targets = rng.sample(payees, args.queries)
+        latencies, found = [], 0
+        for target in targets:
+            query = make_query(target)
+            started = time.perf_counter()
+            hits = index.search(query, limit=10)
+            latencies.append(time.perf_counter() - started)
+            found += any(hit.payee_id == target.id for hit in hits)
+        print(f"{label:<16} recall@10={found / len(targets):.0%} {format_latencies(latencies)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark PSP round-trips per onboarding and end-to-end onboarding latency,
+with and without request coalescing, against a local stub PSP server.
+
+    python -m benchmarks.psp_batching --payees 1000 --concurrency 64
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.application.dtos import OnboardPayeeRequest
+from app.application.onboard_payee import OnboardPayeeService
+from app.infrastructure.database import InMemoryPayeeRepository
+from app.infrastructure.psp_client import BatchingPSPClient, HTTPPSPClient
+from app.infrastructure.pubsub import MockPublishPayeeOnboardedEvent
+from benchmarks.stats import format_latencies
+from tests.support.stub_psp_server import StubPSPServer
+
+
+def run_scenario(name, psp_client, server, payees, concurrency):
+    service = OnboardPayeeService(
+        repository=InMemoryPayeeRepository(),
+        psp_client=psp_client,
+        publish_payee_onboarded_event=MockPublishPayeeOnboardedEvent(),
+    )
+    requests = [
+        OnboardPayeeRequest(
+            name=f"Payee {i}",
+            email=f"payee{i}@example.com",
+            bank_account="GB29NWBK60161331926819",
+        )
+        for i in range(payees)
+    ]
+
+    def onboard(request):
+        started = time.perf_counter()
+        service.execute(request)
+        return time.perf_counter() - started
+
+    calls_before = server.request_count
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(onboard, requests))
+    elapsed = time.perf_counter() - started
+    calls = server.request_count - calls_before
+
+    print(
+        f"{name:<10} onboardings={payees} psp_calls={calls} "
+        f"calls/onboarding={calls / payees:.3f} throughput={payees / elapsed:.0f}/s "
+        f"{format_latencies(latencies)}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--payees", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--psp-latency", type=float, default=0.02, help="seconds per PSP request")
+    parser.add_argument("--max-batch-size", type=int, default=50)
+    parser.add_argument("--max-wait", type=float, default=0.005, help="coalescing window in seconds")
+    args = parser.parse_args()
+
+    with StubPSPServer(latency_seconds=args.psp_latency) as server:
+        direct = HTTPPSPClient(base_url=server.base_url, api_key="bench")
+        run_scenario("direct", direct, server, args.payees, args.concurrency)
+        direct.close()
+
+        http_client = HTTPPSPClient(base_url=server.base_url, api_key="bench")
+        batching = BatchingPSPClient(
+            http_client,
+            max_batch_size=args.max_batch_size,
+            max_wait_seconds=args.max_wait,
+        )
+        run_scenario("batching", batching, server, args.payees, args.concurrency)
+        http_client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Measure import time and cold start (interpreter launch to first onboarding
+response) of the API, each in fresh processes.
+
+    python -m benchmarks.startup --runs 10
+    python -m benchmarks.startup --payees 200000      # against a populated SQLite file
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from app.domain.model import Payee, PayeeStatus
+from app.infrastructure.database import SQLitePayeeRepository
+from app.infrastructure.id_generator import UUID7IdGenerator
+
+# Dependencies worth knowing about when they show up in a cold start.
+HEAVY_MODULES = ("fastapi", "pydantic", "email_validator", "httpx", "sqlite3", "anyio")
+
+CHILD = """
+import json, time
+started = time.monotonic()
+from app.main import create_app
+imported = time.monotonic()
+app = create_app()
+created = time.monotonic()
+from fastapi.testclient import TestClient
+client_imported = time.monotonic()
+with TestClient(app) as client:
+    ready = time.monotonic()
+    response = client.post(
+        "/api/payees",
+        json={"name": "John Doe", "email": "john.doe@example.com", "bank_account": "GB29NWBK60161331926819"},
+    )
+    responded = time.monotonic()
+    client.app.state.container.read_models_ready.wait()
+    warm = time.monotonic()
+print(json.dumps({
+    "started": started,
+    "imported": imported,
+    "created": created,
+    "client_import": client_imported - created,
+    "ready": ready,
+    "responded": responded,
+    "warm": warm,
+    "status": response.status_code,
+}))
+"""
+
+PHASES = ("interpreter", "import app.main", "create_app", "lifespan startup", "first request", "total")
+# Measured separately: from launch until the search index and stats cover the repository.
+WARM = "read models warm"
+
+
+def import_times(module: str) -> List[Tuple[int, int, str]]:
+    # (self us, cumulative us, module) for every module imported by `import module`.
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+def populate(path: str, count: int) -> None:
+    repository = SQLitePayeeRepository(path)
+    id_generator = UUID7IdGenerator()
+    now = datetime.utcnow()
+    for i in range(count):
+        repository.save(
+            Payee(
+                id=id_generator.generate(),
+                name=f"Payee {i}",
+                email=f"payee{i}@example.com",
+                bank_account="GB29NWBK60161331926819",
+                status=PayeeStatus.ACTIVE,
+                psp_reference=f"PSP-{i}",
+                created_at=now,
+                updated_at=now,
+                onboarding_attempts=1,
+                onboarded_at=now,
+            )
+        )
+    repository.close()
+
+
+def cold_start(env: Optional[Mapping[str, str]] = None) -> Dict[str, float]:
+    spawned = time.monotonic()
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, **(env or {})},
+    )
+    child = json.loads(result.stdout.strip().splitlines()[-1])
+    if child["status"] != 201:
+        raise RuntimeError(f"First request failed with status {child['status']}")
+    # TestClient (and httpx) is only here to drive the app; its import is excluded.
+    ready = child["ready"] - child["client_import"]
+    responded = child["responded"] - child["client_import"]
+    return {
+        "interpreter": child["started"] - spawned,
+        "import app.main": child["imported"] - child["started"],
+        "create_app": child["created"] - child["imported"],
+        "lifespan startup": ready - child["created"],
+        "first request": responded - ready,
+        "total": responded - spawned,
+        WARM: max(child["warm"] - child["client_import"], responded) - spawned,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--module", default="app.main", help="module to profile with -X importtime")
+    parser.add_argument("--top", type=int, default=15, help="slowest modules to list")
+    parser.add_argument("--payees", type=int, default=0, help="populate a SQLite file with this many payees")
+    parser.add_argument(
+        "--warmup",
+        nargs="+",
+        default=["sync", "background"],
+        help="READ_MODEL_WARMUP modes to compare with --payees",
+    )
+    args = parser.parse_args()
+
+    rows = import_times(args.module)
+    loaded = {name for _, _, name in rows}
+    total = next((cumulative for _, cumulative, name in rows if name == args.module), 0)
+    print(f"import {args.module}: {total / 1000:.1f}ms, {len(rows)} modules")
+    print(f"  loaded: {', '.join(m for m in HEAVY_MODULES if m in loaded) or '-'}")
+    print(f"  not loaded: {', '.join(m for m in HEAVY_MODULES if m not in loaded) or '-'}")
+    print(f"  slowest by self time:")
+    for self_us, cumulative_us, name in sorted(rows, reverse=True)[: args.top]:
+        print(f"    {self_us / 1000:>7.1f}ms self {cumulative_us / 1000:>7.1f}ms cumulative  {name}")
+
+    if not args.payees:
+        print_cold_start("cold start to first POST /api/payees", [cold_start() for _ in range(args.runs)])
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "payees.db")
+        populate(path, args.payees)
+        for warmup in args.warmup:
+            env = {"PAYEE_REPOSITORY": "sqlite", "DATABASE_PATH": path, "READ_MODEL_WARMUP": warmup}
+            runs = [cold_start(env) for _ in range(args.runs)]
+            print_cold_start(
+                f"cold start, SQLite with {args.payees:,} payees, READ_MODEL_WARMUP={warmup}", runs
+            )
+
+
+def print_cold_start(title: str, runs: List[Dict[str, float]]) -> None:
+    print(f"{title}, {len(runs)} runs:")
+    for phase in PHASES + (WARM,):
+        samples = [run[phase] * 1000 for run in runs]
+        print(
+            f"  {phase:<17} median={statistics.median(samples):>7.1f}ms "
+            f"min={min(samples):>7.1f}ms max={max(samples):>7.1f}ms"
+        )
+
+if __name__ == "__main__":
+    main()
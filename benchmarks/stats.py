@@ -0,0 +1,10 @@
+from typing import Sequence
+
+from app.ui.cli.stats import percentile
+
+
+def format_latencies(samples_seconds: Sequence[float]) -> str:
+    ms = [s * 1000 for s in samples_seconds]
+    return " ".join(
+        f"p{p}={percentile(ms, p):.1f}ms" for p in (50, 95, 99)
+    ) + f" max={max(ms, default=0.0):.1f}ms"
@@ -4,8 +4,126 @@ Component tests for the API.
 Component tests verify complete features end-to-end within a component,
 using real implementations where possible.
 """
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+from dataclasses import replace
+
 import pytest
+from fastapi.testclient import TestClient
+
+from app.config import Settings
+from app.main import create_app
+from app.ui.rest.container import container_for
+
+
+@pytest.fixture
+def sqlite_settings(tmp_path):
+    """Settings for a file-backed SQLite repository."""
+    return Settings(
+        payee_repository="sqlite",
+        database_path=str(tmp_path / "payees.db"),
+        retry_scheduler_enabled=False,
+    )
+
+
+@pytest.mark.component
+class TestServiceGraph:
+    """The service graph is built once per application from settings."""
+
+    def test_lifespan_builds_services_once(self, sample_payee_data):
+        """Test every request is served by the services built at startup."""
+        with TestClient(create_app(settings=Settings(retry_scheduler_enabled=False))) as client:
+            container = client.app.state.container
+            service = container.onboard_payee_service
+
+            created = [client.post("/api/payees", json=sample_payee_data).json() for _ in range(2)]
+
+            assert client.app.state.container is container
+            assert container.onboard_payee_service is service
+            assert {str(p.id) for p in container.payee_repository.list_after(None, 10)} == {
+                payee["id"] for payee in created
+            }
+
+    def test_shutdown_closes_adapters(self, sqlite_settings):
+        """Test leaving the lifespan closes the selected repository."""
+        with TestClient(create_app(settings=sqlite_settings)) as client:
+            repository = client.app.state.container.payee_repository.repository
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            repository.list_after(None, 1)
 
-# TODO: Add API component tests
-# Example: Test complete user flows through the API
+    @pytest.mark.parametrize("warmup", ["sync", "background"])
+    def test_restart_rebuilds_read_models_from_repository(
+        self, sqlite_settings, sample_payee_data, warmup
+    ):
+        """Test stats and search are caught up with a persistent repository after startup."""
+        settings = replace(sqlite_settings, read_model_warmup=warmup)
+        with TestClient(create_app(settings=settings)) as client:
+            created = client.post("/api/payees", json=sample_payee_data).json()
+            stats = client.get("/api/payees/stats").json()
+
+        with TestClient(create_app(settings=settings)) as client:
+            assert client.app.state.container.read_models_ready.wait(5)
+            assert client.get("/api/payees/stats").json() == stats
+            hits = client.get("/api/payees/search", params={"q": "john doe"}).json()["items"]
+            assert [hit["id"] for hit in hits] == [created["id"]]
+
+    def test_readiness_is_reported_until_warm(self, sqlite_settings):
+        """Test stats and health report whether the read models have caught up."""
+        with TestClient(create_app(settings=sqlite_settings)) as client:
+            container = client.app.state.container
+            assert container.read_models_ready.wait(5)
+            assert client.get("/api/payees/stats").json()["ready"] is True
+            assert client.get("/health").json()["read_models_ready"] is True
+
+            container.read_models_ready.clear()
+            assert client.get("/api/payees/stats").json()["ready"] is False
+            assert client.get("/health").json()["read_models_ready"] is False
+
+    def test_app_without_lifespan_has_no_container(self):
+        """Test requests fail clearly when the app is served without its lifespan."""
+        app = create_app(settings=Settings(retry_scheduler_enabled=False))
+
+        with pytest.raises(RuntimeError, match="lifespan"):
+            container_for(app)
+        assert TestClient(app).get("/health").json()["read_models_ready"] is False
+
+    def test_warmup_can_be_disabled(self, sqlite_settings, sample_payee_data):
+        """Test that with warm-up off the read models start empty."""
+        with TestClient(create_app(settings=sqlite_settings)) as client:
+            client.post("/api/payees", json=sample_payee_data)
+
+        settings = replace(sqlite_settings, read_model_warmup="off")
+        with TestClient(create_app(settings=settings)) as client:
+            assert client.get("/api/payees/stats").json()["total"] == 0
+
+    def test_unused_adapters_are_not_imported(self):
+        """Test a started app with the default adapters loads neither httpx nor sqlite3."""
+        code = """
+import json, sys
+from app.application.dtos import OnboardPayeeRequest
+from app.main import create_app
+from app.ui.rest.container import ServiceContainer
+
+app = create_app()
+container = ServiceContainer(app.state.settings)
+container.start()
+container.onboard_payee_service.execute(
+    OnboardPayeeRequest(name="John Doe", email="john.doe@example.com", bank_account="GB29NWBK60161331926819")
+)
+assert container.read_models_ready.wait(5)
+container.close()
+print(json.dumps({m: m in sys.modules for m in ("httpx", "sqlite3")}))
+"""
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "RETRY_SCHEDULER_ENABLED": "false"},
+        )
 
+        assert json.loads(result.stdout) == {"httpx": False, "sqlite3": False}
@@ -1,7 +1,115 @@
 """
 Component tests for CLI interfaces (if applicable).
 """
+import json
+import time
+
 import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.ui.cli.replay_traffic import ReplayResult, main, schedule, summarize
+from app.ui.rest.traffic_capture import TrafficRecorder
+
+
+@pytest.fixture
+def capture_file(tmp_path, sample_payee_data):
+    """Write a small capture file spread over two seconds."""
+    path = tmp_path / "capture.jsonl"
+    base = time.time()
+    lines = [
+        {
+            "timestamp": base + i * 0.5,
+            "method": "POST",
+            "path": "/api/payees",
+            "body": sample_payee_data,
+            "status": 201,
+            "duration_ms": 1.0,
+        }
+        for i in range(4)
+    ]
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\n")
+    return path
+
+
+@pytest.mark.component
+class TestReplayTrafficCLI:
+    """Component tests for the traffic replay tool."""
+
+    def test_schedule_scales_captured_timing(self):
+        """Test that speed divides the captured inter-arrival gaps."""
+        records = [{"timestamp": 100.0}, {"timestamp": 101.0}, {"timestamp": 103.0}]
+
+        assert schedule(records, speed=2) == [0.0, 0.5, 1.5]
+
+    def test_schedule_fixed_rate_ignores_captured_timing(self):
+        """Test that a fixed rate spaces requests evenly."""
+        records = [{"timestamp": 100.0}, {"timestamp": 150.0}, {"timestamp": 151.0}]
+
+        assert schedule(records, rate=4) == [0.0, 0.25, 0.5]
+
+    @pytest.mark.parametrize("speed", ["0", "-1"])
+    def test_speed_must_be_positive(self, capture_file, speed):
+        """Test that a zero or negative speed is rejected before replaying."""
+        with pytest.raises(SystemExit):
+            main([str(capture_file), "--speed", speed])
+
+    def test_summarize_reports_errors_and_windows(self):
+        """Test error rate and per-window aggregation."""
+        results = [
+            ReplayResult(scheduled_at=0.1, latency=0.010, status=201),
+            ReplayResult(scheduled_at=0.2, latency=0.020, status=500),
+            ReplayResult(scheduled_at=1.5, latency=0.030, status=None),
+        ]
+
+        report = summarize(results, window=1.0)
+
+        assert report.requests == 3
+        assert report.error_rate == pytest.approx(2 / 3)
+        assert [w.requests for w in report.windows] == [2, 1]
+        assert report.windows[0].p99_ms == pytest.approx(20.0)
+
+    def test_summarize_uses_actual_span_of_last_window(self):
+        """Test that a partial last window is not reported as under-loaded."""
+        results = [
+            ReplayResult(scheduled_at=0.0, latency=0.0, status=201),
+            ReplayResult(scheduled_at=0.5, latency=0.0, status=201),
+            ReplayResult(scheduled_at=1.0, latency=0.0, status=201),
+            ReplayResult(scheduled_at=1.2, latency=0.05, status=201),
+        ]
+
+        report = summarize(results, window=1.0)
+
+        assert report.windows[0].throughput == pytest.approx(2.0)
+        assert report.windows[1].throughput == pytest.approx(2 / 0.25)
+
+    def test_replay_capture_in_process(self, capture_file, capsys):
+        """Test replaying a capture against create_app() at high speed."""
+        exit_code = main([str(capture_file), "--speed", "100"])
+
+        output = capsys.readouterr().out
+        assert exit_code == 0
+        assert "total: 4 requests" in output
+
+    def test_replay_recorded_capture_without_errors(self, tmp_path, capsys):
+        """Test that a capture written by TrafficRecorder replays cleanly."""
+        capture_path = tmp_path / "capture.jsonl"
+        recorder = TrafficRecorder(str(capture_path))
+        with TestClient(create_app(traffic_recorder=recorder)) as client:
+            for i in range(5):
+                response = client.post(
+                    "/api/payees",
+                    json={
+                        "name": f"Payee Number {i}",
+                        "email": f"payee{i}@example.com",
+                        "bank_account": f"GB29NWBK6016133192681{i}",
+                    },
+                )
+                assert response.status_code == 201
 
-# TODO: Add CLI component tests if you add CLI commands
+        exit_code = main([str(capture_path), "--speed", "100"])
 
+        output = capsys.readouterr().out
+        assert exit_code == 0
+        assert "total: 5 requests" in output
+        assert "errors 0.0%" in output
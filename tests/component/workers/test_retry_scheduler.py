@@ -0,0 +1,133 @@
+"""
+Component tests for the FAILED payee retry scheduler.
+"""
+import random
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from app.application.onboard_payee import OnboardPayeeService
+from app.application.retry_failed_payee import RetryFailedPayeeService
+from app.domain.model import Payee, PayeeStatus
+from app.domain.ports import PSPClient
+from app.infrastructure.database import InMemoryPayeeRepository
+from app.ui.workers.retry_scheduler import FailedPayeeRetryScheduler
+
+
+class FlakyPSPClient(PSPClient):
+    """PSP double that fails each payee a fixed number of times and tracks concurrency."""
+
+    def __init__(self, failures_per_payee):
+        self.failures_per_payee = failures_per_payee
+        self.calls = {}
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def onboard_payee(self, name, email, bank_account):
+        with self._lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+            self.calls[email] = self.calls.get(email, 0) + 1
+            fail = self.calls[email] <= self.failures_per_payee
+        try:
+            if fail:
+                raise ConnectionError("PSP unavailable")
+            return f"PSP-{email}"
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+
+def build_scheduler(repository, psp_client, **kwargs):
+    onboard_service = OnboardPayeeService(
+        repository=repository,
+        psp_client=psp_client,
+        publish_payee_onboarded_event=Mock(),
+    )
+    return FailedPayeeRetryScheduler(
+        repository=repository,
+        retry_service=RetryFailedPayeeService(repository, onboard_service),
+        base_delay=0.001,
+        max_delay=0.01,
+        rng=random.Random(0),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def repository():
+    """Repository holding 50 payees whose first onboarding attempt failed."""
+    repository = InMemoryPayeeRepository()
+    for i in range(50):
+        payee = Payee.create(
+            name=f"Payee {i}",
+            email=f"payee{i}@example.com",
+            bank_account="GB29NWBK60161331926819",
+        )
+        payee.record_onboarding_attempt()
+        payee.mark_as_failed()
+        repository.save(payee)
+    return repository
+
+
+@pytest.mark.component
+class TestFailedPayeeRetryScheduler:
+    """Component tests for bulk retry of FAILED payees."""
+
+    def test_failed_payees_recover_with_bounded_concurrency(self, repository):
+        """Test that every failed payee is retried until onboarded."""
+        psp_client = FlakyPSPClient(failures_per_payee=2)
+        scheduler = build_scheduler(repository, psp_client, max_concurrency=4, batch_size=7)
+
+        scheduler.scan()
+        scheduler.start()
+        try:
+            assert scheduler.wait_until_idle(timeout=10)
+        finally:
+            scheduler.stop()
+
+        assert repository.find_by_status(PayeeStatus.FAILED, None, 100) == []
+        active = repository.find_by_status(PayeeStatus.ACTIVE, None, 100)
+        assert len(active) == 50
+        # Original attempt plus two failed retries and one successful retry.
+        assert {payee.onboarding_attempts for payee in active} == {4}
+        assert scheduler.recovered == 50
+        assert psp_client.max_in_flight <= 4
+
+    def test_payees_are_left_failed_after_max_attempts(self, repository):
+        """Test that retries stop once max_attempts is reached."""
+        psp_client = FlakyPSPClient(failures_per_payee=100)
+        scheduler = build_scheduler(repository, psp_client, max_attempts=3)
+
+        scheduler.scan()
+        scheduler.start()
+        try:
+            assert scheduler.wait_until_idle(timeout=10)
+        finally:
+            scheduler.stop()
+
+        failed = repository.find_by_status(PayeeStatus.FAILED, None, 100)
+        assert len(failed) == 50
+        assert {payee.onboarding_attempts for payee in failed} == {3}
+        assert scheduler.gave_up == 50
+
+    def test_scan_schedules_each_failed_payee_once(self, repository):
+        """Test that rescanning does not double-schedule payees."""
+        scheduler = build_scheduler(repository, FlakyPSPClient(failures_per_payee=0), batch_size=8)
+
+        assert scheduler.scan() == 50
+        assert scheduler.scan() == 0
+        assert scheduler.pending == 50
+
+    def test_scan_skips_payees_at_max_attempts(self, repository):
+        """Test that exhausted payees are neither scheduled nor read by the scan."""
+        repository.find_by_status = Mock(wraps=repository.find_by_status)
+        scheduler = build_scheduler(repository, FlakyPSPClient(failures_per_payee=0), max_attempts=1)
+
+        assert scheduler.scan() == 0
+        # A single, empty page: the 50 exhausted payees are filtered by the query.
+        repository.find_by_status.assert_called_once_with(
+            PayeeStatus.FAILED, None, scheduler.batch_size, max_attempts=1
+        )
@@ -1,7 +1,158 @@
 """
 Component tests for background workers (if applicable).
 """
+import threading
+from datetime import datetime
+from uuid import uuid4
+
 import pytest
 
-# TODO: Add worker component tests if you add background workers
+from app.domain.events import PayeeOnboardedEvent
+from app.infrastructure.consumer import PartitionedConsumer
+from app.infrastructure.pubsub import (
+    PAYEE_TOPIC,
+    InMemoryKafkaBroker,
+    KafkaPublishPayeeOnboardedEvent,
+)
+
+
+def make_event(payee_id, sequence):
+    return PayeeOnboardedEvent.create(
+        payee_id=payee_id,
+        name="John Doe",
+        email="john.doe@example.com",
+        psp_reference=f"PSP-{sequence}",
+        timestamp=datetime.utcnow(),
+    )
+
+
+class CollectingHandler:
+    """Batch handler that records every event it receives."""
+
+    def __init__(self):
+        self.batches = []
+        self.events = []
+        self._lock = threading.Lock()
+
+    def __call__(self, records):
+        with self._lock:
+            self.batches.append(records)
+            self.events.extend(record.value for record in records)
+
+
+@pytest.fixture
+def broker():
+    return InMemoryKafkaBroker(partitions=8)
+
+
+@pytest.fixture
+def publisher(broker):
+    return KafkaPublishPayeeOnboardedEvent(kafka_publisher=broker)
+
+
+@pytest.mark.component
+class TestPayeeTopicConsumer:
+    """Component tests for consuming payee-topic with a worker pool."""
+
+    def test_events_are_processed_in_order_per_payee(self, broker, publisher):
+        """Test parallel workers keep each payee's events in publish order."""
+        payee_ids = [uuid4() for _ in range(20)]
+        for sequence in range(10):
+            for payee_id in payee_ids:
+                publisher.execute(make_event(payee_id, sequence))
+
+        handler = CollectingHandler()
+        consumer = PartitionedConsumer(broker, PAYEE_TOPIC, "test-group", handler, workers=4)
+        consumer.start()
+        try:
+            assert consumer.wait_until_caught_up(timeout=5)
+        finally:
+            consumer.stop()
+
+        assert len(handler.events) == 200
+        for payee_id in payee_ids:
+            references = [
+                event["psp_reference"]
+                for event in handler.events
+                if event["payee_id"] == str(payee_id)
+            ]
+            assert references == [f"PSP-{sequence}" for sequence in range(10)]
+
+    def test_redelivered_events_are_skipped(self, broker, publisher):
+        """Test that an event delivered twice reaches the handler once."""
+        event = make_event(uuid4(), 0)
+        publisher.execute(event)
+        publisher.execute(event)
+
+        handler = CollectingHandler()
+        consumer = PartitionedConsumer(broker, PAYEE_TOPIC, "test-group", handler, workers=2)
+        consumer.start()
+        try:
+            assert consumer.wait_until_caught_up(timeout=5)
+        finally:
+            consumer.stop()
+
+        assert len(handler.events) == 1
+        assert consumer.duplicates_skipped == 1
+
+    def test_offsets_are_committed_only_after_successful_handling(self, broker, publisher):
+        """Test that a failing batch is retried and committed once it succeeds."""
+        payee_id = uuid4()
+        publisher.execute(make_event(payee_id, 0))
+        partition = broker.partition_for(str(payee_id))
+        attempts = []
+
+        def flaky_handler(records):
+            attempts.append(len(records))
+            if len(attempts) == 1:
+                assert broker.committed("test-group", PAYEE_TOPIC, partition) == 0
+                raise RuntimeError("downstream unavailable")
+
+        consumer = PartitionedConsumer(
+            broker, PAYEE_TOPIC, "test-group", flaky_handler, workers=1, retry_backoff=0.01
+        )
+        consumer.start()
+        try:
+            assert consumer.wait_until_caught_up(timeout=5)
+        finally:
+            consumer.stop()
+
+        assert attempts == [1, 1]
+        assert broker.committed("test-group", PAYEE_TOPIC, partition) == 1
+
+    def test_poison_record_is_dead_lettered_after_max_retries(self, broker, publisher):
+        """Test that a record failing past max_retries is skipped and committed."""
+        payee_id = uuid4()
+        for sequence in range(2):
+            publisher.execute(make_event(payee_id, sequence))
+        partition = broker.partition_for(str(payee_id))
+        handled = []
+        dead_letters = []
+
+        def handler(records):
+            if any(record.offset == 0 for record in records):
+                raise RuntimeError("cannot handle event")
+            handled.extend(records)
+
+        consumer = PartitionedConsumer(
+            broker,
+            PAYEE_TOPIC,
+            "test-group",
+            handler,
+            workers=1,
+            retry_backoff=0.01,
+            max_retries=2,
+            dead_letter=lambda record, error: dead_letters.append((record, error)),
+        )
+        consumer.start()
+        try:
+            assert consumer.wait_until_caught_up(timeout=5)
+        finally:
+            consumer.stop()
 
+        assert [record.offset for record, _ in dead_letters] == [0]
+        assert isinstance(dead_letters[0][1], RuntimeError)
+        assert [record.offset for record in handled] == [1]
+        assert broker.committed("test-group", PAYEE_TOPIC, partition) == 2
+        assert consumer.dead_lettered == 1
+        assert consumer.processed == 1
@@ -3,6 +3,54 @@ Integration tests for database repository implementations.
 """
 import pytest
 
-# TODO: Add database integration tests
-# Example: Test actual database operations with a test database
+from app.domain.model import Payee, PayeeStatus
+from app.infrastructure.database import SQLitePayeeRepository
 
+
+@pytest.fixture
+def repository(tmp_path):
+    """Create a SQLite repository backed by a temporary file."""
+    repository = SQLitePayeeRepository(str(tmp_path / "payees.db"))
+    yield repository
+    repository.close()
+
+
+@pytest.mark.integration
+class TestSQLitePayeeRepository:
+    """Integration tests for the SQLite repository."""
+
+    def test_save_and_find_by_id_round_trips_payee(self, repository, sample_payee_data):
+        """Test that a saved payee is loaded back unchanged."""
+        payee = Payee.create(**sample_payee_data)
+        repository.save(payee)
+
+        assert repository.find_by_id(payee.id) == payee
+
+    def test_update_persists_changes(self, repository, sample_payee_data):
+        """Test that updates overwrite the stored payee."""
+        payee = Payee.create(**sample_payee_data)
+        repository.save(payee)
+        payee.set_psp_reference("PSP-REF-12345")
+        payee.mark_as_failed()
+
+        repository.update(payee)
+
+        stored = repository.find_by_id(payee.id)
+        assert stored.status == PayeeStatus.FAILED
+        assert stored.psp_reference == "PSP-REF-12345"
+
+    def test_update_unknown_payee_raises(self, repository, sample_payee_data):
+        """Test that updating a payee that was never saved fails."""
+        with pytest.raises(ValueError):
+            repository.update(Payee.create(**sample_payee_data))
+
+    def test_find_by_status_seeks_status_index_in_id_order(self, repository):
+        """Test that status scans use the index for both the id bound and the order."""
+        plan = repository._connection.execute(
+            "EXPLAIN QUERY PLAN " + repository._FIND_BY_STATUS,
+            (PayeeStatus.FAILED.value, b"", 3, 100),
+        ).fetchall()
+        details = " ".join(row[-1] for row in plan)
+
+        assert "payees_status_id_attempts (status=? AND id>?)" in details
+        assert "TEMP B-TREE" not in details
@@ -9,9 +9,10 @@ from app.main import create_app
 
 @pytest.fixture
 def client():
-    """Create a test client."""
+    """Create a test client running the app's lifespan."""
     app = create_app()
-    return TestClient(app)
+    with TestClient(app) as client:
+        yield client
 
 
 class TestPayeeAPI:
@@ -47,3 +48,52 @@ class TestPayeeAPI:
         
         assert response.status_code == 422  # Validation error
 
+
+    def test_list_payees_pages_in_creation_order(self, client, sample_payee_data):
+        """Test cursor pagination over newly created payees."""
+        created = [
+            client.post("/api/payees", json=sample_payee_data).json()["id"]
+            for _ in range(3)
+        ]
+
+        response = client.get("/api/payees", params={"after": created[0], "limit": 2})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data["items"]] == created[1:]
+        assert data["next_cursor"] == created[2]
+
+    def test_search_payees_by_misspelled_name(self, client):
+        """Test fuzzy search through the API."""
+        created = client.post(
+            "/api/payees",
+            json={
+                "name": "Bartholomew Quigley",
+                "email": "bquigley@example.com",
+                "bank_account": "GB29NWBK60161331926819",
+            },
+        ).json()
+
+        response = client.get("/api/payees/search", params={"q": "bartolomew quigly"})
+
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert items[0]["id"] == created["id"]
+        assert items[0]["score"] > 0
+
+    def test_payee_stats_follow_onboardings(self, client, sample_payee_data):
+        """Test the stats read model reflects new onboardings and survives a rebuild."""
+        before = client.get("/api/payees/stats").json()
+
+        created = client.post("/api/payees", json=sample_payee_data).json()
+
+        response = client.get("/api/payees/stats")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == before["total"] + 1
+        assert data["status_counts"]["ACTIVE"] == before["status_counts"]["ACTIVE"] + 1
+        assert data["latest_onboarded"][0]["payee_id"] == created["id"]
+
+        rebuilt = client.post("/api/payees/stats/rebuild")
+        assert rebuilt.status_code == 200
+        assert rebuilt.json() == data
@@ -0,0 +1,51 @@
+"""
+Integration tests for the HTTP PSP client against a local stub PSP server.
+"""
+import pytest
+
+from app.domain.ports import PSPPayee
+from app.infrastructure.psp_client import HTTPPSPClient, PSPError
+from tests.support.stub_psp_server import StubPSPServer
+
+
+@pytest.fixture
+def psp_server():
+    """Run a stub PSP server for the duration of a test."""
+    with StubPSPServer(latency_seconds=0) as server:
+        yield server
+
+
+@pytest.fixture
+def psp_client(psp_server):
+    """Create an HTTP PSP client pointed at the stub server."""
+    client = HTTPPSPClient(base_url=psp_server.base_url, api_key="test-key")
+    yield client
+    client.close()
+
+
+class TestHTTPPSPClient:
+    """Integration tests for single and bulk PSP onboarding."""
+
+    def test_onboard_payee_returns_reference(self, psp_client):
+        """Test onboarding a single payee."""
+        reference = psp_client.onboard_payee("John Doe", "john@example.com", "GB29")
+
+        assert reference.startswith("PSP-")
+
+    def test_onboard_payee_rejection_raises_psp_error(self, psp_client):
+        """Test that a PSP rejection surfaces as a PSPError."""
+        with pytest.raises(PSPError):
+            psp_client.onboard_payee("John Doe", "reject@example.com", "GB29")
+
+    def test_onboard_payees_uses_single_request(self, psp_client, psp_server):
+        """Test that a batch is sent in one request with per-payee results."""
+        results = psp_client.onboard_payees(
+            [
+                PSPPayee("A", "a@example.com", "GB29"),
+                PSPPayee("B", "reject@example.com", "GB29"),
+            ]
+        )
+
+        assert psp_server.request_count == 1
+        assert results[0].startswith("PSP-")
+        assert isinstance(results[1], PSPError)
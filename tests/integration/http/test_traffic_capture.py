@@ -0,0 +1,77 @@
+"""
+Integration tests for the traffic capture middleware.
+"""
+import json
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.ui.rest.traffic_capture import TrafficRecorder
+
+
+@pytest.fixture
+def capture_path(tmp_path):
+    return tmp_path / "capture.jsonl"
+
+
+def read_capture(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestTrafficCapture:
+    """Integration tests for recording POST /api/payees traffic."""
+
+    def test_onboarding_requests_are_recorded_without_pii(self, capture_path, sample_payee_data):
+        """Test that a request is captured with its PII replaced."""
+        recorder = TrafficRecorder(str(capture_path), salt="test")
+        with TestClient(create_app(traffic_recorder=recorder)) as client:
+            client.post("/api/payees", json=sample_payee_data)
+            client.get("/health")
+
+        [record] = read_capture(capture_path)
+        assert record["method"] == "POST"
+        assert record["path"] == "/api/payees"
+        assert record["status"] is not None
+        assert record["timestamp"] > 0
+        body = record["body"]
+        assert body["name"] != sample_payee_data["name"]
+        assert body["email"].endswith("@example.com")
+        assert body["email"] != sample_payee_data["email"]
+        assert body["bank_account"][:2] == "GB"
+        assert len(body["bank_account"]) == len(sample_payee_data["bank_account"])
+        assert sample_payee_data["bank_account"] not in capture_path.read_text()
+
+    def test_scrubbing_is_stable_within_a_capture(self, capture_path, sample_payee_data):
+        """Test that the same payee data maps to the same pseudonyms."""
+        recorder = TrafficRecorder(str(capture_path))
+        body = json.dumps(sample_payee_data).encode()
+
+        assert recorder.scrub(body) == recorder.scrub(body)
+        recorder.close()
+
+    def test_sample_rate_zero_records_nothing(self, capture_path, sample_payee_data, monkeypatch):
+        """Test that sampling can disable recording."""
+        monkeypatch.setenv("TRAFFIC_CAPTURE_PATH", str(capture_path))
+        monkeypatch.setenv("TRAFFIC_CAPTURE_SAMPLE_RATE", "0")
+
+        with TestClient(create_app()) as client:
+            client.post("/api/payees", json=sample_payee_data)
+
+        assert capture_path.read_text() == ""
+
+    def test_records_are_written_off_the_request_path(self, capture_path):
+        """Test that a slow writer drops records instead of blocking callers."""
+        recorder = TrafficRecorder(str(capture_path), max_pending=1)
+        gate = threading.Event()
+        scrub = recorder.scrub
+        recorder.scrub = lambda body: gate.wait() and scrub(body)
+
+        for i in range(5):
+            recorder.record(float(i), "POST", "/api/payees", b"{}", 201, 1.0)
+        assert recorder.dropped >= 1
+
+        gate.set()
+        recorder.close()
+        assert len(read_capture(capture_path)) + recorder.dropped == 5
@@ -3,6 +3,101 @@ Integration tests for repository layer.
 """
 import pytest
 
-# TODO: Add repository integration tests
-# Example: Test repository implementations against real databases
+from app.domain.model import Payee, PayeeStatus
+from app.infrastructure.database import InMemoryPayeeRepository, SQLitePayeeRepository
+from app.infrastructure.id_generator import UUID7IdGenerator
 
+
+@pytest.fixture(params=["memory", "sqlite"])
+def repository(request):
+    """Run each test against every PayeeRepository implementation."""
+    if request.param == "memory":
+        yield InMemoryPayeeRepository()
+    else:
+        repository = SQLitePayeeRepository()
+        yield repository
+        repository.close()
+
+
+@pytest.fixture
+def payees(repository):
+    """Save ten payees with time-ordered ids."""
+    id_generator = UUID7IdGenerator()
+    created = [
+        Payee.create(
+            name=f"Payee {i}",
+            email=f"payee{i}@example.com",
+            bank_account="GB29NWBK60161331926819",
+            id_generator=id_generator,
+        )
+        for i in range(10)
+    ]
+    for payee in created:
+        repository.save(payee)
+    return created
+
+
+@pytest.mark.integration
+class TestRepositoryCreationOrder:
+    """Integration tests for creation-ordered range scans."""
+
+    def test_list_after_without_cursor_starts_at_oldest(self, repository, payees):
+        """Test that the first page starts at the first created payee."""
+        page = repository.list_after(None, 3)
+
+        assert [p.id for p in page] == [p.id for p in payees[:3]]
+
+    def test_paging_with_cursor_returns_every_payee_once(self, repository, payees):
+        """Test that following cursors walks all payees in creation order."""
+        seen, cursor = [], None
+        while True:
+            page = repository.list_after(cursor, 4)
+            if not page:
+                break
+            seen.extend(p.id for p in page)
+            cursor = page[-1].id
+
+        assert seen == [p.id for p in payees]
+
+    def test_list_after_last_payee_is_empty(self, repository, payees):
+        """Test that nothing is returned after the newest payee."""
+        assert repository.list_after(payees[-1].id, 10) == []
+
+
+@pytest.mark.integration
+class TestRepositoryStatusIndex:
+    """Integration tests for status lookups."""
+
+    def test_find_by_status_follows_status_changes(self, repository, payees):
+        """Test that updates move payees between statuses."""
+        for payee in payees[::2]:
+            payee.mark_as_failed()
+            repository.update(payee)
+
+        failed = repository.find_by_status(PayeeStatus.FAILED, None, 100)
+        pending = repository.find_by_status(PayeeStatus.PENDING, None, 100)
+
+        assert [p.id for p in failed] == [p.id for p in payees[::2]]
+        assert [p.id for p in pending] == [p.id for p in payees[1::2]]
+
+    def test_find_by_status_pages_with_cursor(self, repository, payees):
+        """Test that status lookups page by id cursor."""
+        first = repository.find_by_status(PayeeStatus.PENDING, None, 4)
+        second = repository.find_by_status(PayeeStatus.PENDING, first[-1].id, 4)
+
+        assert [p.id for p in first + second] == [p.id for p in payees[:8]]
+
+    def test_find_by_status_excludes_payees_at_max_attempts(self, repository, payees):
+        """Test that max_attempts skips exhausted payees while keeping id order across attempt counts."""
+        for i, payee in enumerate(payees):
+            for _ in range(i % 4):
+                payee.record_onboarding_attempt()
+            payee.mark_as_failed()
+            repository.update(payee)
+
+        retryable = [p.id for p in payees if p.onboarding_attempts < 3]
+        first = repository.find_by_status(PayeeStatus.FAILED, None, 4, max_attempts=3)
+        rest = repository.find_by_status(PayeeStatus.FAILED, first[-1].id, 100, max_attempts=3)
+
+        assert [p.id for p in first + rest] == retryable
+        assert len(repository.find_by_status(PayeeStatus.FAILED, None, 100)) == 10
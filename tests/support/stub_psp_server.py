@@ -0,0 +1,96 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from uuid import uuid4
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    # The default listen backlog of 5 overflows under concurrent clients, and
+    # dropped SYNs are retried after ~1s, which shows up as latency outliers.
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+class StubPSPServer:
+    """Local stand-in for a PSP exposing single and bulk onboarding endpoints.
+
+    Every request costs ``latency_seconds`` regardless of payload size, which is
+    the round-trip overhead batching is meant to amortise. Payees whose email
+    contains ``reject`` are refused individually so per-item errors can be
+    exercised.
+    """
+
+    def __init__(self, latency_seconds: float = 0.02, host: str = "127.0.0.1", port: int = 0):
+        self.latency_seconds = latency_seconds
+        self.request_count = 0
+        self.payee_count = 0
+        self._lock = threading.Lock()
+        self._server = _StubHTTPServer((host, port), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubPSPServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubPSPServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _record(self, payees: int) -> None:
+        with self._lock:
+            self.request_count += 1
+            self.payee_count += payees
+
+    @staticmethod
+    def _onboard(payee: dict) -> dict:
+        if "reject" in payee.get("email", ""):
+            return {"error": f"Payee {payee['email']} rejected"}
+        return {"reference": f"PSP-{uuid4().hex[:12].upper()}"}
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                time.sleep(stub.latency_seconds)
+
+                if self.path == "/payees":
+                    stub._record(1)
+                    result = stub._onboard(body)
+                    status = 201 if "reference" in result else 422
+                    self._reply(status, result)
+                elif self.path == "/payees/batch":
+                    payees = body.get("payees", [])
+                    stub._record(len(payees))
+                    self._reply(200, {"results": [stub._onboard(p) for p in payees]})
+                else:
+                    self._reply(404, {"error": "Not found"})
+
+            def _reply(self, status: int, payload: dict) -> None:
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,297 @@
+"""
+Unit tests for the payee statistics read model.
+"""
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.application.dtos import OnboardPayeeRequest
+from app.application.onboard_payee import OnboardPayeeService
+from app.application.payee_stats import PayeeStatsProjection, RebuildPayeeStatsService
+from app.application.retry_failed_payee import RetryFailedPayeeService
+from app.domain.events import PayeeOnboardedEvent, PayeeStatusChangedEvent
+from app.domain.model import Payee, PayeeStatus
+from app.infrastructure.database import InMemoryPayeeRepository
+from app.infrastructure.id_generator import UUID7IdGenerator
+from app.infrastructure.pubsub import InMemoryDomainEventBus, MockPublishPayeeOnboardedEvent
+
+
+def onboarded_event(timestamp):
+    return PayeeOnboardedEvent.create(
+        payee_id=uuid4(),
+        name="John Doe",
+        email="john.doe@example.com",
+        psp_reference="PSP-REF",
+        timestamp=timestamp,
+    )
+
+
+class TestPayeeStatsProjection:
+    """Test cases for incremental maintenance of the read model."""
+
+    def test_status_changes_move_counts(self):
+        """Test status counters follow the transitions."""
+        projection = PayeeStatsProjection()
+        payee_id = uuid4()
+
+        now = datetime.utcnow()
+
+        projection.handle(PayeeStatusChangedEvent.create(payee_id, None, PayeeStatus.PENDING, now))
+        projection.handle(
+            PayeeStatusChangedEvent.create(payee_id, PayeeStatus.PENDING, PayeeStatus.FAILED, now)
+        )
+
+        stats = projection.snapshot()
+        assert stats.total == 1
+        assert stats.status_counts["PENDING"] == 0
+        assert stats.status_counts["FAILED"] == 1
+
+    def test_onboardings_are_bucketed_per_hour(self):
+        """Test onboardings are counted per hour, oldest bucket first."""
+        projection = PayeeStatsProjection()
+        base = datetime(2024, 1, 1, 10, 15)
+
+        for offset in (0, 20, 70):
+            projection.handle(onboarded_event(base + timedelta(minutes=offset)))
+
+        stats = projection.snapshot()
+        assert [(h.hour.hour, h.count) for h in stats.onboarded_per_hour] == [(10, 2), (11, 1)]
+
+    def test_only_retained_hours_are_kept(self):
+        """Test the oldest hourly buckets are dropped past the retention."""
+        projection = PayeeStatsProjection(retention_hours=2)
+        base = datetime(2024, 1, 1, 10)
+
+        for hours in (0, 1, 2):
+            projection.handle(onboarded_event(base + timedelta(hours=hours)))
+
+        hours = [h.hour.hour for h in projection.snapshot().onboarded_per_hour]
+        assert hours == [11, 12]
+
+    def test_latest_onboarded_keeps_newest_first(self):
+        """Test only the most recent onboardings are listed, newest first."""
+        projection = PayeeStatsProjection(latest_limit=2)
+        base = datetime(2024, 1, 1, 10)
+        events = [onboarded_event(base + timedelta(minutes=m)) for m in (5, 1, 9)]
+
+        for event in events:
+            projection.handle(event)
+
+        latest = projection.snapshot().latest_onboarded
+        assert [p.payee_id for p in latest] == [events[2].payee_id, events[0].payee_id]
+
+
+class TestPayeeStatsRebuild:
+    """Test cases for rebuilding while events keep arriving."""
+
+    def test_events_already_reflected_by_a_rebuild_are_ignored(self, sample_payee_data):
+        """Test a late event for a payee the rebuild already counted changes nothing."""
+        repository = InMemoryPayeeRepository()
+        payee = Payee.create(**sample_payee_data)
+        created = payee.pull_events()
+        payee.set_psp_reference("PSP-1")
+        payee.activate()
+        repository.save(payee)
+        projection = PayeeStatsProjection()
+
+        projection.rebuild(repository)
+        for event in created + payee.pull_events():
+            projection.handle(event)
+        projection.handle(
+            PayeeOnboardedEvent.create(
+                payee.id, payee.name, payee.email, payee.psp_reference, payee.onboarded_at
+            )
+        )
+
+        stats = projection.snapshot()
+        assert stats.total == 1
+        assert stats.status_counts["ACTIVE"] == 1
+        assert sum(h.count for h in stats.onboarded_per_hour) == 1
+
+    def test_handlers_are_not_blocked_by_a_rebuild(self):
+        """Test events are applied during the scan and replayed onto the rebuilt state."""
+        release = threading.Event()
+        scanning = threading.Event()
+
+        class SlowRepository(InMemoryPayeeRepository):
+            def list_after(self, after_id, limit):
+                scanning.set()
+                release.wait(5)
+                return super().list_after(after_id, limit)
+
+        projection = PayeeStatsProjection()
+        rebuild = threading.Thread(target=projection.rebuild, args=(SlowRepository(),))
+        rebuild.start()
+        assert scanning.wait(5)
+
+        started = time.monotonic()
+        projection.handle(
+            PayeeStatusChangedEvent.create(uuid4(), None, PayeeStatus.PENDING, datetime.utcnow())
+        )
+        blocked_for = time.monotonic() - started
+        release.set()
+        rebuild.join(5)
+
+        assert blocked_for < 1
+        assert projection.snapshot().total == 1
+
+
+class TestPayeeStatsConsistency:
+    """The incrementally maintained state must match a rebuild from the repository."""
+
+    class FlakyPSPClient:
+        def __init__(self, rng):
+            self.rng = rng
+
+        def onboard_payee(self, name, email, bank_account):
+            if self.rng.random() < 0.4:
+                raise RuntimeError("PSP unavailable")
+            return f"PSP-{uuid4().hex[:8]}"
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_incremental_state_matches_rebuild(self, seed):
+        """Test mixed onboard, fail and retry flows leave a rebuildable state."""
+        rng = random.Random(seed)
+        repository = InMemoryPayeeRepository()
+        bus = InMemoryDomainEventBus()
+        projection = PayeeStatsProjection(latest_limit=5)
+        bus.subscribe(projection.handle)
+        onboard = OnboardPayeeService(
+            repository=repository,
+            psp_client=self.FlakyPSPClient(rng),
+            publish_payee_onboarded_event=MockPublishPayeeOnboardedEvent(),
+            id_generator=UUID7IdGenerator(),
+            publish_domain_event=bus,
+        )
+        retry = RetryFailedPayeeService(repository=repository, onboard_payee_service=onboard)
+
+        failed = []
+        for i in range(60):
+            request = OnboardPayeeRequest(
+                name=f"Payee {i}", email=f"payee{i}@example.com", bank_account="GB29NWBK60161331926819"
+            )
+            try:
+                onboard.execute(request)
+            except RuntimeError:
+                failed.append(repository.list_after(None, 1000)[-1].id)
+        for payee_id in failed:
+            try:
+                retry.execute(payee_id)
+            except RuntimeError:
+                pass
+
+        incremental = projection.snapshot()
+        rebuilt = RebuildPayeeStatsService(
+            repository=repository,
+            projection=PayeeStatsProjection(latest_limit=5),
+        ).execute()
+
+        assert incremental.total == 60
+        assert incremental.status_counts["FAILED"] > 0
+        assert incremental == rebuilt
+
+    def test_rebuild_during_concurrent_onboardings_counts_each_payee_once(self):
+        """Test rebuilding while onboardings wait on a slow PSP."""
+        repository = InMemoryPayeeRepository()
+        bus = InMemoryDomainEventBus()
+        projection = PayeeStatsProjection()
+        bus.subscribe(projection.handle)
+        in_psp = threading.Barrier(6)
+
+        class SlowPSPClient:
+            def onboard_payee(self, name, email, bank_account):
+                in_psp.wait(5)
+                time.sleep(0.1)
+                return f"PSP-{email}"
+
+        onboard = OnboardPayeeService(
+            repository=repository,
+            psp_client=SlowPSPClient(),
+            publish_payee_onboarded_event=MockPublishPayeeOnboardedEvent(),
+            publish_domain_event=bus,
+        )
+        threads = [
+            threading.Thread(
+                target=onboard.execute,
+                args=(
+                    OnboardPayeeRequest(
+                        name=f"Payee {i}",
+                        email=f"payee{i}@example.com",
+                        bank_account="GB29NWBK60161331926819",
+                    ),
+                ),
+            )
+            for i in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+
+        in_psp.wait(5)
+        RebuildPayeeStatsService(repository=repository, projection=projection).execute()
+        for thread in threads:
+            thread.join(5)
+
+        stats = projection.snapshot()
+        assert stats.total == 5
+        assert stats.status_counts["ACTIVE"] == 5
+        assert stats.status_counts["PENDING"] == 0
+        assert sum(h.count for h in stats.onboarded_per_hour) == 5
+        fresh = PayeeStatsProjection()
+        fresh.rebuild(repository)
+        assert stats == fresh.snapshot()
+
+    def test_repeated_rebuilds_under_load_converge(self):
+        """Test rebuilds racing with many onboardings, failures and retries."""
+        rng = random.Random(7)
+        repository = InMemoryPayeeRepository()
+        bus = InMemoryDomainEventBus()
+        projection = PayeeStatsProjection()
+        bus.subscribe(projection.handle)
+        onboard = OnboardPayeeService(
+            repository=repository,
+            psp_client=self.FlakyPSPClient(rng),
+            publish_payee_onboarded_event=MockPublishPayeeOnboardedEvent(),
+            publish_domain_event=bus,
+        )
+        retry = RetryFailedPayeeService(repository=repository, onboard_payee_service=onboard)
+        done = threading.Event()
+
+        def onboard_many(worker):
+            for i in range(40):
+                request = OnboardPayeeRequest(
+                    name=f"Payee {worker}-{i}",
+                    email=f"payee{worker}-{i}@example.com",
+                    bank_account="GB29NWBK60161331926819",
+                )
+                try:
+                    onboard.execute(request)
+                except RuntimeError:
+                    pass
+            for payee in repository.find_by_status(PayeeStatus.FAILED, None, 1000):
+                try:
+                    retry.execute(payee.id)
+                except Exception:
+                    pass
+
+        def rebuild_until_done():
+            while not done.is_set():
+                projection.rebuild(repository, batch_size=16)
+
+        rebuilder = threading.Thread(target=rebuild_until_done)
+        workers = [threading.Thread(target=onboard_many, args=(w,)) for w in range(8)]
+        rebuilder.start()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(30)
+        done.set()
+        rebuilder.join(30)
+
+        fresh = PayeeStatsProjection()
+        fresh.rebuild(repository)
+        assert projection.snapshot().total == 320
+        assert projection.snapshot() == fresh.snapshot()
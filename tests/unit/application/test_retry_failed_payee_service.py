@@ -0,0 +1,84 @@
+"""
+Unit tests for the RetryFailedPayeeService application service.
+"""
+from unittest.mock import Mock
+
+import pytest
+
+from app.application.onboard_payee import OnboardPayeeService
+from app.application.retry_failed_payee import RetryFailedPayeeService
+from app.domain.exceptions import InvalidStatusTransitionError, PayeeNotFoundError
+from app.domain.model import Payee, PayeeStatus
+
+
+class TestRetryFailedPayeeService:
+    """Test cases for the RetryFailedPayeeService."""
+
+    @pytest.fixture
+    def mock_repository(self):
+        """Mock repository."""
+        return Mock()
+
+    @pytest.fixture
+    def mock_psp_client(self):
+        """Mock PSP client."""
+        client = Mock()
+        client.onboard_payee.return_value = "PSP-REF-12345"
+        return client
+
+    @pytest.fixture
+    def service(self, mock_repository, mock_psp_client):
+        """Create service with mocked dependencies."""
+        return RetryFailedPayeeService(
+            repository=mock_repository,
+            onboard_payee_service=OnboardPayeeService(
+                repository=mock_repository,
+                psp_client=mock_psp_client,
+                publish_payee_onboarded_event=Mock(),
+            ),
+        )
+
+    @pytest.fixture
+    def failed_payee(self, sample_payee_data):
+        """A payee whose first onboarding attempt failed."""
+        payee = Payee.create(**sample_payee_data)
+        payee.record_onboarding_attempt()
+        payee.mark_as_failed()
+        return payee
+
+    def test_retry_onboards_failed_payee(self, service, mock_repository, failed_payee):
+        """Test that a failed payee is retried and activated."""
+        mock_repository.find_by_id.return_value = failed_payee
+
+        response = service.execute(failed_payee.id)
+
+        assert response.psp_reference == "PSP-REF-12345"
+        assert failed_payee.status == PayeeStatus.ACTIVE
+        assert failed_payee.onboarding_attempts == 2
+
+    def test_retry_failure_marks_payee_failed_again(
+        self, service, mock_repository, mock_psp_client, failed_payee
+    ):
+        """Test that a failed retry leaves the payee FAILED with the attempt recorded."""
+        mock_repository.find_by_id.return_value = failed_payee
+        mock_psp_client.onboard_payee.side_effect = Exception("PSP Error")
+
+        with pytest.raises(Exception, match="PSP Error"):
+            service.execute(failed_payee.id)
+
+        assert failed_payee.status == PayeeStatus.FAILED
+        assert failed_payee.onboarding_attempts == 2
+
+    def test_retry_unknown_payee_raises(self, service, mock_repository, failed_payee):
+        """Test retrying a payee that does not exist."""
+        mock_repository.find_by_id.return_value = None
+
+        with pytest.raises(PayeeNotFoundError):
+            service.execute(failed_payee.id)
+
+    def test_retry_payee_that_is_not_failed_raises(self, service, mock_repository, sample_payee_data):
+        """Test that only FAILED payees are retried."""
+        mock_repository.find_by_id.return_value = Payee.create(**sample_payee_data)
+
+        with pytest.raises(InvalidStatusTransitionError):
+            service.execute(mock_repository.find_by_id.return_value.id)
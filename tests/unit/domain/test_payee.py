@@ -1,8 +1,12 @@
 """
 Unit tests for the Payee domain entity.
 """
+from unittest.mock import Mock
+from uuid import uuid4
+
 import pytest
 
+from app.domain.exceptions import InvalidStatusTransitionError
 from app.domain.model import Payee, PayeeStatus
 
 
@@ -26,6 +30,16 @@ class TestPayeeCreation:
         assert payee.created_at is not None
         assert payee.updated_at is not None
 
+    def test_create_payee_uses_injected_id_generator(self, sample_payee_data):
+        """Test that the id comes from the given IdGenerator."""
+        expected_id = uuid4()
+        id_generator = Mock()
+        id_generator.generate.return_value = expected_id
+
+        payee = Payee.create(**sample_payee_data, id_generator=id_generator)
+
+        assert payee.id == expected_id
+
 
 class TestPayeeStatusTransitions:
     """Test cases for payee status transitions."""
@@ -52,3 +66,68 @@ class TestPayeeStatusTransitions:
         
         assert payee.psp_reference == psp_ref
 
+
+    def test_retry_failed_payee_returns_to_pending(self, sample_payee_data):
+        """Test that a failed payee can be retried."""
+        payee = Payee.create(**sample_payee_data)
+        payee.mark_as_failed()
+
+        payee.retry_onboarding()
+
+        assert payee.status == PayeeStatus.PENDING
+
+    def test_retry_pending_payee_raises(self, sample_payee_data):
+        """Test that only failed payees can be retried."""
+        payee = Payee.create(**sample_payee_data)
+
+        with pytest.raises(InvalidStatusTransitionError):
+            payee.retry_onboarding()
+
+    def test_record_onboarding_attempt(self, sample_payee_data):
+        """Test that onboarding attempts are counted."""
+        payee = Payee.create(**sample_payee_data)
+        payee.record_onboarding_attempt()
+        payee.record_onboarding_attempt()
+
+        assert payee.onboarding_attempts == 2
+
+
+class TestPayeeDomainEvents:
+    """Test cases for status change events collected on the entity."""
+
+    def test_create_records_initial_status(self, sample_payee_data):
+        """Test a new payee records its initial status with no previous status."""
+        payee = Payee.create(**sample_payee_data)
+
+        events = payee.pull_events()
+
+        assert len(events) == 1
+        assert events[0].payee_id == payee.id
+        assert events[0].previous_status is None
+        assert events[0].new_status == PayeeStatus.PENDING
+
+    def test_transitions_record_previous_and_new_status(self, sample_payee_data):
+        """Test every transition records a status changed event."""
+        payee = Payee.create(**sample_payee_data)
+        payee.pull_events()
+
+        payee.mark_as_failed()
+        payee.retry_onboarding()
+
+        events = payee.pull_events()
+        assert [(e.previous_status, e.new_status) for e in events] == [
+            (PayeeStatus.PENDING, PayeeStatus.FAILED),
+            (PayeeStatus.FAILED, PayeeStatus.PENDING),
+        ]
+        assert payee.pull_events() == []
+
+    def test_set_psp_reference_sets_onboarded_at_once(self, sample_payee_data):
+        """Test the first PSP reference stamps the onboarding time."""
+        payee = Payee.create(**sample_payee_data)
+
+        payee.set_psp_reference("PSP-1")
+        onboarded_at = payee.onboarded_at
+        payee.set_psp_reference("PSP-2")
+
+        assert onboarded_at is not None
+        assert payee.onboarded_at == onboarded_at
@@ -0,0 +1,83 @@
+"""
+Unit tests for configuration-driven adapter selection.
+"""
+import pytest
+
+from app.config import Settings
+from app.infrastructure.database import InMemoryPayeeRepository, SQLitePayeeRepository
+from app.infrastructure.id_generator import SnowflakeIdGenerator
+from app.infrastructure.registry import AdapterRegistry, adapters
+
+
+class TestSettings:
+    """Test cases for reading settings from the environment."""
+
+    def test_defaults_without_environment(self):
+        """Test an empty environment selects the in-process adapters."""
+        settings = Settings.from_env({})
+
+        assert settings == Settings()
+        assert settings.payee_repository == "memory"
+        assert settings.psp_client == "mock"
+
+    def test_reads_environment(self):
+        """Test values are parsed from their environment variables."""
+        settings = Settings.from_env(
+            {
+                "PAYEE_REPOSITORY": "sqlite",
+                "PSP_BATCHING": "true",
+                "PSP_MAX_BATCH_SIZE": "20",
+                "RETRY_SCHEDULER_ENABLED": "false",
+                "READ_MODEL_WARMUP": "sync",
+                "TRAFFIC_CAPTURE_PATH": "capture.jsonl",
+                "TRAFFIC_CAPTURE_SAMPLE_RATE": "0.1",
+            }
+        )
+
+        assert settings.payee_repository == "sqlite"
+        assert settings.psp_batching is True
+        assert settings.psp_max_batch_size == 20
+        assert settings.retry_scheduler_enabled is False
+        assert settings.read_model_warmup == "sync"
+        assert settings.traffic_capture_path == "capture.jsonl"
+        assert settings.traffic_capture_salt is None
+        assert settings.traffic_capture_sample_rate == 0.1
+
+
+class TestAdapterRegistry:
+    """Test cases for the adapter registry."""
+
+    def test_creates_selected_adapter(self, tmp_path):
+        """Test adapters are built from the settings they are selected by."""
+        settings = Settings(database_path=str(tmp_path / "payees.db"), snowflake_worker_id=7)
+
+        memory = adapters.create("payee_repository", "memory", settings)
+        sqlite = adapters.create("payee_repository", "sqlite", settings)
+        snowflake = adapters.create("id_generator", "snowflake", settings)
+
+        assert isinstance(memory, InMemoryPayeeRepository)
+        assert isinstance(sqlite, SQLitePayeeRepository)
+        assert sqlite.path == settings.database_path
+        assert isinstance(snowflake, SnowflakeIdGenerator)
+        assert snowflake.worker_id == 7
+        sqlite.close()
+
+    def test_unknown_adapter_lists_choices(self):
+        """Test an unknown name fails with the available choices."""
+        with pytest.raises(ValueError, match="expected one of: memory, sqlite"):
+            adapters.create("payee_repository", "postgres", Settings())
+
+    def test_factories_run_only_when_selected(self):
+        """Test registering an adapter does not build it."""
+        registry = AdapterRegistry()
+        calls = []
+
+        @registry.register("psp_client", "fake")
+        def fake(settings):
+            calls.append(settings)
+            return "fake"
+
+        assert registry.names("psp_client") == ["fake"]
+        assert calls == []
+        assert registry.create("psp_client", "fake", Settings()) == "fake"
+        assert len(calls) == 1
@@ -0,0 +1,85 @@
+"""
+Unit tests for the BatchingPSPClient adapter.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from app.domain.ports import PSPClient, PSPPayee
+from app.infrastructure.psp_client import BatchingPSPClient
+
+
+class RecordingPSPClient(PSPClient):
+    """PSP double that records every batch it receives."""
+
+    def __init__(self):
+        self.batches = []
+        self._lock = threading.Lock()
+
+    def onboard_payee(self, name, email, bank_account):
+        raise AssertionError("Batching client should only use onboard_payees")
+
+    def onboard_payees(self, payees):
+        with self._lock:
+            self.batches.append(list(payees))
+        return [
+            ValueError(f"rejected {p.email}") if "reject" in p.email else f"REF-{p.email}"
+            for p in payees
+        ]
+
+
+class TestBatchingPSPClient:
+    """Test cases for coalescing onboard_payee calls into batches."""
+
+    @pytest.fixture
+    def psp(self):
+        return RecordingPSPClient()
+
+    def test_concurrent_calls_are_coalesced_into_one_batch(self, psp):
+        """Test that calls arriving within the window share a single PSP call."""
+        client = BatchingPSPClient(psp, max_batch_size=10, max_wait_seconds=1.0)
+
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            references = list(
+                pool.map(
+                    lambda i: client.onboard_payee(f"P{i}", f"p{i}@example.com", "GB00"),
+                    range(10),
+                )
+            )
+
+        assert len(psp.batches) == 1
+        assert references == [f"REF-p{i}@example.com" for i in range(10)]
+
+    def test_each_caller_receives_its_own_error(self, psp):
+        """Test that a rejected payee does not fail the rest of its batch."""
+        client = BatchingPSPClient(psp, max_batch_size=2, max_wait_seconds=1.0)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            ok = pool.submit(client.onboard_payee, "Ok", "ok@example.com", "GB00")
+            rejected = pool.submit(client.onboard_payee, "No", "reject@example.com", "GB00")
+
+            assert ok.result() == "REF-ok@example.com"
+            with pytest.raises(ValueError, match="rejected reject@example.com"):
+                rejected.result()
+
+        assert len(psp.batches) == 1
+
+    def test_single_call_is_flushed_after_window(self, psp):
+        """Test that a lone caller is not blocked waiting for a full batch."""
+        client = BatchingPSPClient(psp, max_batch_size=50, max_wait_seconds=0.01)
+
+        reference = client.onboard_payee("Solo", "solo@example.com", "GB00")
+
+        assert reference == "REF-solo@example.com"
+        assert psp.batches == [[PSPPayee("Solo", "solo@example.com", "GB00")]]
+
+    def test_batch_failure_is_propagated_to_every_caller(self):
+        """Test that a failed batch call raises for all of its callers."""
+        psp = Mock(spec=PSPClient)
+        psp.onboard_payees.side_effect = RuntimeError("PSP down")
+        client = BatchingPSPClient(psp, max_batch_size=1)
+
+        with pytest.raises(RuntimeError, match="PSP down"):
+            client.onboard_payee("A", "a@example.com", "GB00")
@@ -0,0 +1,46 @@
+"""
+Unit tests for the time-ordered IdGenerator adapters.
+"""
+import pytest
+
+from app.infrastructure.id_generator import SnowflakeIdGenerator, UUID7IdGenerator
+
+
+class TestUUID7IdGenerator:
+    """Test cases for UUIDv7 generation."""
+
+    def test_generates_version_7_rfc_uuids(self):
+        """Test that ids carry the UUIDv7 version and RFC variant."""
+        payee_id = UUID7IdGenerator().generate()
+
+        assert payee_id.version == 7
+        assert payee_id.variant == "specified in RFC 4122"
+
+    def test_ids_are_strictly_increasing(self):
+        """Test that ids generated in a tight loop keep creation order."""
+        generator = UUID7IdGenerator()
+
+        ids = [generator.generate() for _ in range(10_000)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+
+class TestSnowflakeIdGenerator:
+    """Test cases for Snowflake-style int64 generation."""
+
+    def test_ids_are_positive_int64_and_increasing(self):
+        """Test that ids fit a signed int64 and keep creation order."""
+        generator = SnowflakeIdGenerator(worker_id=7)
+
+        ids = [generator.next_int() for _ in range(10_000)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+        assert all(0 < value < 2**63 for value in ids)
+        assert all((value >> 12) & 0x3FF == 7 for value in ids)
+
+    def test_invalid_worker_id_is_rejected(self):
+        """Test that worker ids outside 10 bits are rejected."""
+        with pytest.raises(ValueError):
+            SnowflakeIdGenerator(worker_id=1024)
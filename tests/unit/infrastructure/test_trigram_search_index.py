@@ -0,0 +1,160 @@
+"""
+Unit tests for the trigram payee search index.
+"""
+import threading
+
+import pytest
+
+from app.domain.model import Payee
+from app.infrastructure.database import InMemoryPayeeRepository
+from app.infrastructure.search import SearchIndexingPayeeRepository, TrigramPayeeSearchIndex
+
+
+def make_payee(name, email):
+    return Payee.create(name=name, email=email, bank_account="GB29NWBK60161331926819")
+
+
+@pytest.fixture
+def index():
+    return TrigramPayeeSearchIndex()
+
+
+@pytest.fixture
+def payees(index):
+    """Index a handful of payees with similar names."""
+    created = {
+        "john": make_payee("John Doe", "john.doe@example.com"),
+        "jonathan": make_payee("Jonathan Smith", "jsmith@acme.io"),
+        "maria": make_payee("Maria Garcia", "maria@example.com"),
+        "mario": make_payee("Mario Garza", "mgarza@example.com"),
+    }
+    for payee in created.values():
+        index.index(payee)
+    return created
+
+
+class TestTrigramPayeeSearchIndex:
+    """Test cases for fuzzy search over name and email."""
+
+    def test_index_if_absent_keeps_existing_document(self, index):
+        """Test that bulk loading a stale copy does not replace a live update."""
+        payee = make_payee("Bartholomew Quigley", "bq@example.com")
+        stale = make_payee("Old Name", "old@example.com")
+        stale.id = payee.id
+
+        index.index(payee)
+        index.index_if_absent(stale)
+
+        assert index.search("old name", limit=5) == []
+        assert [hit.payee_id for hit in index.search("quigley", limit=5)] == [payee.id]
+
+    def test_misspelled_name_finds_payee(self, index, payees):
+        """Test that a typo still matches the intended payee."""
+        hits = index.search("jonathan smiht", limit=5)
+
+        assert hits[0].payee_id == payees["jonathan"].id
+
+    def test_results_are_ranked_by_score(self, index, payees):
+        """Test that the closest match ranks first."""
+        hits = index.search("maria", limit=5)
+
+        assert [hit.payee_id for hit in hits] == [payees["maria"].id, payees["mario"].id]
+        assert hits[0].score > hits[1].score
+
+    def test_search_matches_email(self, index, payees):
+        """Test that email addresses are searchable."""
+        hits = index.search("jsmith@acme", limit=5)
+
+        assert hits[0].payee_id == payees["jonathan"].id
+
+    def test_unrelated_query_returns_nothing(self, index, payees):
+        """Test that queries below the score threshold return no results."""
+        assert index.search("zzzz", limit=5) == []
+
+    def test_reindexed_payee_is_found_by_new_name_only(self, index, payees):
+        """Test that updating a payee replaces its indexed text."""
+        payee = payees["john"]
+        payee.name = "Percival Blackwood"
+        payee.email = "percival@example.com"
+
+        index.index(payee)
+
+        assert [hit.payee_id for hit in index.search("percival", limit=5)] == [payee.id]
+        assert payee.id not in [hit.payee_id for hit in index.search("john doe", limit=5)]
+
+    def test_tombstones_are_compacted(self, index, payees):
+        """Test that repeated renames do not grow the index without bound."""
+        payee = payees["john"]
+        for i in range(10):
+            payee.name = f"Renamed {i}"
+            index.index(payee)
+
+        stats = index.stats()
+        assert stats["documents"] <= 2 * stats["live_documents"] + 1
+        assert index.search("renamed 9", limit=1)[0].payee_id == payee.id
+
+    def test_changes_during_compaction_are_kept(self, index, payees):
+        """Test that payees indexed while compaction runs off-lock survive the swap."""
+        renamed = payees["john"]
+        added = make_payee("Ophelia Thistlewood", "ophelia@example.com")
+        rebuild = index._rebuild
+
+        def rebuild_with_concurrent_writes(*args):
+            index.index(added)
+            renamed.name = "Final Name"
+            index.index(renamed)
+            return rebuild(*args)
+
+        index._rebuild = rebuild_with_concurrent_writes
+        for i in range(5):
+            renamed.name = f"Renamed {i}"
+            index.index(renamed)
+
+        assert [hit.payee_id for hit in index.search("thistlewood", limit=5)] == [added.id]
+        assert [hit.payee_id for hit in index.search("final name", limit=5)] == [renamed.id]
+        assert index.search("renamed", limit=5) == []
+        stats = index.stats()
+        assert stats["live_documents"] == 5
+        assert stats["documents"] == 6
+
+    def test_search_does_not_block_indexing(self, index, payees):
+        """Test that indexing proceeds while a search is counting."""
+        counting = threading.Event()
+        release = threading.Event()
+
+        class SlowPostings(list):
+            def __iter__(self):
+                counting.set()
+                release.wait(timeout=5)
+                return super().__iter__()
+
+        index._postings["  j"] = SlowPostings(index._postings["  j"])
+        searcher = threading.Thread(target=index.search, args=("john", 5))
+        searcher.start()
+        try:
+            assert counting.wait(timeout=5)
+            indexer = threading.Thread(
+                target=index.index, args=(make_payee("Unrelated Person", "up@example.com"),)
+            )
+            indexer.start()
+            indexer.join(timeout=1)
+            assert not indexer.is_alive()
+        finally:
+            release.set()
+            searcher.join(timeout=5)
+
+class TestSearchIndexingPayeeRepository:
+    """Test cases for keeping the index in sync with the repository."""
+
+    def test_save_and_update_are_indexed(self):
+        """Test that saved and updated payees are searchable."""
+        index = TrigramPayeeSearchIndex()
+        repository = SearchIndexingPayeeRepository(InMemoryPayeeRepository(), index)
+        payee = make_payee("John Doe", "john.doe@example.com")
+
+        repository.save(payee)
+        assert index.search("john", limit=1)[0].payee_id == payee.id
+
+        payee.email = "johnny@example.org"
+        repository.update(payee)
+        assert index.search("johnny", limit=1)[0].payee_id == payee.id